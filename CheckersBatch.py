@@ -0,0 +1,136 @@
+# Author: Biereagu Sochima
+# GitHub username: kodejuice
+# Date: 18/10/2026
+# Description: Vectorized move generation for batches of Checkers boards with NumPy
+
+# CheckersBatch.py
+
+import numpy as np
+
+from CheckersGame import Checkers, PIECE_NAMES, SQUARE_COORDS, DIRECTIONS, BLACK, MAN, KING, TRIPLE_KING
+
+# Boards are (N, 8, 8) integer arrays of cell codes: 0 for an empty square,
+# 1 + the piece code for a piece, so CELL_NAMES[cell] is the string Checkers.board holds
+EMPTY = 0
+OFF_BOARD = -1
+CELL_NAMES = (None,) + PIECE_NAMES
+CELL_CODES = {name: cell for cell, name in enumerate(CELL_NAMES)}
+
+# CELL_SQUARES[row * 8 + col] is the square index the game uses for a cell (-1 if it has none)
+CELL_SQUARES = [-1] * 64
+for _square, (_row, _col) in enumerate(SQUARE_COORDS):
+  CELL_SQUARES[_row * 8 + _col] = _square
+
+
+def encode_boards(boards):
+  """Return the (N, 8, 8) array of cell codes of N boards given as lists of lists of piece names"""
+  return np.array([[[CELL_CODES[piece] for piece in row] for row in board] for board in boards], dtype=np.int8)
+
+
+def encode_game(game):
+  """Return the (8, 8) array of cell codes of the position of a game"""
+  cells = np.zeros((8, 8), dtype=np.int8)
+  for code, mask in enumerate(game._bitboards):
+    while mask:
+      bit = mask & -mask
+      mask ^= bit
+      cells[SQUARE_COORDS[bit.bit_length() - 1]] = code + 1
+  return cells
+
+
+def decode_board(cells):
+  """Return the board (list of lists of piece names) of an (8, 8) array of cell codes"""
+  return [[CELL_NAMES[cell] for cell in row] for row in np.asarray(cells).tolist()]
+
+
+def batch_moves(boards, sides):
+  """Generate the moves of N boards in one vectorized pass.
+  boards is an (N, 8, 8) array of cell codes, sides the player to move (one for all boards or one per board).
+  Returns a dict of arrays:
+    "moves": (N, 8, 8, 4) bool, the piece on (row, col) can make a simple move in DIRECTIONS[d].
+      Simple moves are only legal on boards where no capture is possible
+    "jumps": (N, 8, 8, 4, 8) bool, the piece on (row, col) can capture one piece in DIRECTIONS[d]
+      landing at the distance of the last index
+    "must_capture": (N,) bool, a capture is possible so the player has to capture
+    "scalar": (N,) bool, the player to move has triple kings, their moves are left out of the arrays
+      and the board needs the scalar move generation"""
+  boards = np.asarray(boards, dtype=np.int8)
+  n = len(boards)
+  sides = np.broadcast_to(np.asarray(sides), (n,)).reshape(n, 1, 1)
+  own_low = 1 + 3 * sides
+  enemy_low = 4 - 3 * sides
+
+  padded = np.full((n, 24, 24), OFF_BOARD, dtype=np.int8)
+  padded[:, 8:16, 8:16] = boards
+  own = (boards >= own_low) & (boards < own_low + 3)
+  rank = (boards - 1) % 3
+  men = own & (rank == MAN)
+  kings = own & (rank == KING)
+  triple_kings = own & (rank == TRIPLE_KING)
+
+  moves = np.zeros((n, 8, 8, 4), dtype=bool)
+  jumps = np.zeros((n, 8, 8, 4, 8), dtype=bool)
+  for d, (dx, dy) in enumerate(DIRECTIONS):
+    # ahead[k] holds, for every square, the cell k steps away in this direction
+    ahead = [None] + [padded[:, 8 + k * dx:16 + k * dx, 8 + k * dy:16 + k * dy] for k in range(1, 8)]
+    empty = [None] + [cells == EMPTY for cells in ahead[1:]]
+    enemy = [None] + [(cells >= enemy_low) & (cells < enemy_low + 3) for cells in ahead[1:]]
+
+    # black men move up the board, white men down
+    forward_men = men & ((sides == BLACK) == (dx < 0))
+    moves[..., d] = (forward_men | kings) & empty[1]
+    jumps[..., d, 2] = forward_men & enemy[1] & empty[2]
+
+    # kings capture the first piece along the diagonal if it is an enemy, and land on any empty square behind it
+    clear = kings
+    for k in range(1, 7):
+      run = clear & enemy[k]
+      for landing in range(k + 1, 8):
+        run = run & empty[landing]
+        jumps[..., d, landing] |= run
+      clear = clear & empty[k]
+
+  return {
+      "moves": moves,
+      "jumps": jumps,
+      "must_capture": jumps.reshape(n, -1).any(axis=1),
+      "scalar": triple_kings.reshape(n, -1).any(axis=1),
+  }
+
+
+def batch_player_moves(boards, sides):
+  """Return the legal moves of the player to move of N boards, the same lists _get_player_moves returns.
+  Boards without captures and triple kings come from batch_moves, the others from the scalar
+  move generation (one game is reused for all of them)"""
+  boards = np.asarray(boards, dtype=np.int8)
+  n = len(boards)
+  sides = np.broadcast_to(np.asarray(sides), (n,))
+  result = batch_moves(boards, sides)
+  scalar = (result["scalar"] | result["must_capture"]).tolist()
+
+  legal_moves = [[] for _ in range(n)]
+  for board, row, col, d in zip(*(index.tolist() for index in np.nonzero(result["moves"]))):
+    if not scalar[board]:
+      dx, dy = DIRECTIONS[d]
+      legal_moves[board] += [((row, col), (row + dx, col + dy), 0)]
+
+  game = None
+  for board in range(n):
+    if scalar[board]:
+      if game is None:
+        game = Checkers()
+        game.create_player("White", "White")
+        game.create_player("Black", "Black")
+      load_cells(game, boards[board])
+      legal_moves[board] = game._get_player_moves(int(sides[board]))
+  return legal_moves
+
+
+def load_cells(game, cells):
+  """Set the position of a game from an (8, 8) array of cell codes"""
+  flat = np.asarray(cells).reshape(64)
+  occupied = np.flatnonzero(flat)
+  bitboards = [0] * len(PIECE_NAMES)
+  for cell, code in zip(occupied.tolist(), flat[occupied].tolist()):
+    bitboards[code - 1] |= 1 << CELL_SQUARES[cell]
+  game._set_bitboards(bitboards)
@@ -0,0 +1,82 @@
+import random
+import unittest
+
+from CheckersGame import Checkers, BLACK, WHITE, PIECE_NAMES, parse_layout
+
+try:
+  import numpy
+  from CheckersBatch import *
+except ImportError:
+  numpy = None
+
+
+def random_board(rng, pieces):
+  """Return a random board with pieces drawn from given piece names"""
+  board = [[None for _ in range(8)] for _ in range(8)]
+  for row in range(8):
+    for col in range(8):
+      if (row + col) % 2 == 1 and rng.random() < 0.35:
+        board[row][col] = rng.choice(pieces)
+  return board
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestCheckersBatch(unittest.TestCase):
+  def setUp(self):
+    self.game = Checkers()
+    self.game.create_player("Adam", "White")
+    self.game.create_player("Lucy", "Black")
+
+  def test_encoding(self):
+    cells = encode_boards([self.game.board])
+    self.assertEqual(cells.shape, (1, 8, 8))
+    self.assertEqual(cells[0, 0, 1], CELL_CODES["White"])
+    self.assertEqual(decode_board(cells[0]), self.game.board)
+    self.assertTrue((encode_game(self.game) == cells[0]).all())
+
+  def test_start_position(self):
+    result = batch_moves(encode_boards([self.game.board] * 2), [BLACK, WHITE])
+    self.assertEqual(result["moves"].sum(axis=(1, 2, 3)).tolist(), [7, 7])
+    self.assertFalse(result["must_capture"].any())
+    self.assertFalse(result["scalar"].any())
+
+  def test_single_jumps(self):
+    board = parse_layout([
+        "-  -  -  -  -  -  -  - ",
+        "-  -  -  -  -  -  -  - ",
+        "-  -  -  -  -  -  -  - ",
+        "-  -  -  -  -  -  -  - ",
+        "-  -  -  -  -  W  -  - ",
+        "-  -  -  -  -  -  -  - ",
+        "-  -  -  W  -  -  -  - ",
+        "-  -  Bk -  B  -  -  - ",
+    ])
+    result = batch_moves(encode_boards([board]), BLACK)
+    self.assertTrue(result["must_capture"][0])
+    # the man jumps (6, 3) to (5, 2), the king jumps it landing on (5, 4)
+    self.assertTrue(result["jumps"][0, 7, 4, 0, 2])
+    self.assertTrue(result["jumps"][0, 7, 2, 1, 2])
+    # the king cannot go on past (4, 5), there is a piece on it
+    self.assertFalse(result["jumps"][0, 7, 2, 1, 3])
+    self.assertEqual(int(result["jumps"].sum()), 2)
+
+  def test_matches_scalar_moves(self):
+    rng = random.Random(5)
+    boards, sides = [], []
+    for i in range(300):
+      pieces = PIECE_NAMES if i % 3 == 0 else [p for p in PIECE_NAMES if "Triple" not in p]
+      boards += [random_board(rng, pieces)]
+      sides += [rng.randrange(2)]
+    cells = encode_boards(boards)
+    result = batch_moves(cells, sides)
+    legal_moves = batch_player_moves(cells, sides)
+    for i, board in enumerate(boards):
+      self.game.board = board
+      expected = self.game._get_player_moves(sides[i])
+      self.assertEqual(legal_moves[i], expected)
+      if not result["scalar"][i]:
+        self.assertEqual(bool(result["must_capture"][i]), any(m[2] > 0 for m in expected))
+
+
+if __name__ == '__main__':
+  unittest.main()
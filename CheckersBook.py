@@ -0,0 +1,135 @@
+# Author: Biereagu Sochima
+# GitHub username: kodejuice
+# Date: 18/10/2026
+# Description: Opening book of Checkers positions built from recorded or self-played games
+
+# CheckersBook.py
+
+import mmap
+import random
+import struct
+import sys
+
+from CheckersGame import Checkers, BLACK, WHITE, new_game, transform_square
+from CheckersRecord import MoveLogReader
+from CheckersSelfPlay import self_play
+
+# The book file is a header and entries sorted by position hash, one per move played in a position:
+#   canonical_hash(), start and destination (row * 8 + col) in the canonical position, games the move was played in,
+#   points of the player who played it (2 per win, 1 per draw or unfinished game)
+# Positions with white to move share the entries of their equivalent positions with black to move
+MAGIC = b"CKBK"
+VERSION = 2
+HEADER = struct.Struct("<4sBxxxI")
+ENTRY = struct.Struct("<QBBII")
+
+
+def build(path, games, max_plies=16, min_games=2):
+  """Write the book of the first max_plies plies of games to path.
+  games is an iterable of (moves, winner) where moves are the (start, destination) plies of a game
+  from the start position and winner the color that won (None for a draw or an unfinished game).
+  Moves played in fewer than min_games games are left out. Returns the number of entries written"""
+  stats = {}
+  for moves, winner in games:
+    game = new_game()
+    for start, destination in moves[:max_plies]:
+      side = game.player_to_move_index
+      key, transform = game.canonical_hash()
+      book_start, book_destination = transform_square(start, transform), transform_square(destination, transform)
+      key = (key, book_start[0] * 8 + book_start[1], book_destination[0] * 8 + book_destination[1])
+      entry = stats.setdefault(key, [0, 0])
+      entry[0] += 1
+      entry[1] += 1 if winner is None else 2 * (winner == side)
+      game.make_move(start, destination)
+
+  entries = sorted((key, value) for key, value in stats.items() if value[0] >= min_games)
+  with open(path, "wb") as out:
+    out.write(HEADER.pack(MAGIC, VERSION, len(entries)))
+    for (key, start, destination), (count, points) in entries:
+      out.write(ENTRY.pack(key, start, destination, count, points))
+  return len(entries)
+
+
+def self_play_games(games, seed=0, processes=None, max_plies=300, engine_depth=0):
+  """Yield the (moves, winner) of self-played games, for build"""
+  colors = {"Black": BLACK, "White": WHITE}
+  for result in self_play(games, seed, processes, max_plies, engine_depth):
+    yield result["moves"], colors.get(result["winner"])
+
+
+def recorded_games(paths):
+  """Yield the (moves, winner) of the games of move logs (see CheckersRecord) that start from the start position"""
+  start_board = Checkers().board
+  colors = {"Black": BLACK, "White": WHITE}
+  for path in paths:
+    with MoveLogReader(path) as reader:
+      if reader.position(0).board != start_board:
+        continue
+      winner = reader.position(len(reader)).game_winner()
+      yield [(ply[0], ply[1]) for ply in reader], colors.get(winner)
+
+
+class OpeningBook:
+  """Memory mapped book written by build, positions are found by binary search on their hash"""
+
+  def __init__(self, path):
+    with open(path, "rb") as book:
+      self._data = mmap.mmap(book.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, self.size = HEADER.unpack_from(self._data, 0)
+    if magic != MAGIC or version != VERSION:
+      raise ValueError(path + " is not an opening book of version %d" % VERSION)
+
+  def __len__(self):
+    return self.size
+
+  def close(self):
+    self._data.close()
+
+  def _key(self, index):
+    return ENTRY.unpack_from(self._data, HEADER.size + index * ENTRY.size)[0]
+
+  def moves(self, game):
+    """Return the book moves of the position of the game as [(start, destination, games, score), ...],
+    most played first. score is the share of points the player to move made with the move (0 to 1)"""
+    key, transform = game.canonical_hash()
+    low, high = 0, self.size
+    while low < high:
+      middle = (low + high) // 2
+      if self._key(middle) < key:
+        low = middle + 1
+      else:
+        high = middle
+
+    legal = {(m[0], m[1]) for m in game.legal_moves()}
+    moves = []
+    for index in range(low, self.size):
+      entry_key, start, destination, count, points = ENTRY.unpack_from(self._data, HEADER.size + index * ENTRY.size)
+      if entry_key != key:
+        break
+      move = (transform_square(divmod(start, 8), transform), transform_square(divmod(destination, 8), transform))
+      # a hash collision could bring moves of another position
+      if move in legal:
+        moves += [move + (count, points / (2 * count))]
+    moves.sort(key=lambda m: m[2], reverse=True)
+    return moves
+
+  def choose(self, game, rng=random):
+    """Return a (start, destination) book move picked with a probability proportional to the games
+    it was played in, None if the position is not in the book"""
+    moves = self.moves(game)
+    if not moves:
+      return None
+    move = rng.choices(moves, weights=[m[2] for m in moves])[0]
+    return move[0], move[1]
+
+
+def main(argv):
+  path = argv[1] if len(argv) > 1 else "opening.book"
+  games = int(argv[2]) if len(argv) > 2 else 1000
+  engine_depth = int(argv[3]) if len(argv) > 3 else 0
+  entries = build(path, self_play_games(games, engine_depth=engine_depth))
+  print("%d book moves from %d games written to %s" % (entries, games, path))
+
+
+if __name__ == '__main__':
+  main(sys.argv)
@@ -0,0 +1,75 @@
+import os
+import random
+import tempfile
+import unittest
+from CheckersBook import *
+from CheckersEngine import SearchEngine
+from CheckersRecord import RecordedGame
+from CheckersGame import new_game
+
+
+class TestCheckersBook(unittest.TestCase):
+  def setUp(self):
+    self.directory = tempfile.mkdtemp()
+    self.path = os.path.join(self.directory, "opening.book")
+
+  def test_lookup(self):
+    # (5, 0)-(4, 1) was played in two games, won once by black, (5, 2)-(4, 3) in one game
+    games = [
+        ([((5, 0), (4, 1)), ((2, 1), (3, 0))], BLACK),
+        ([((5, 0), (4, 1)), ((2, 3), (3, 2))], WHITE),
+        ([((5, 2), (4, 3)), ((2, 1), (3, 0))], None),
+    ]
+    self.assertEqual(build(self.path, games, min_games=1), 5)
+    book = OpeningBook(self.path)
+    game = new_game()
+    self.assertEqual(book.moves(game), [((5, 0), (4, 1), 2, 0.5), ((5, 2), (4, 3), 1, 0.5)])
+
+    game.make_move((5, 0), (4, 1))
+    self.assertEqual(sorted(book.moves(game)), [((2, 1), (3, 0), 1, 0.0), ((2, 3), (3, 2), 1, 1.0)])
+    self.assertIn(book.choose(game, random.Random(1)), [((2, 1), (3, 0)), ((2, 3), (3, 2))])
+    # the equivalent position with black to move shares the entries, turned half a turn
+    rotated = new_game()
+    rotated._set_bitboards(game.canonical_position()[0])
+    self.assertEqual(sorted(book.moves(rotated)), [((5, 4), (4, 5), 1, 1.0), ((5, 6), (4, 7), 1, 0.0)])
+    game.make_move((2, 3), (3, 2))
+    self.assertEqual(book.moves(game), [])
+    self.assertIsNone(book.choose(game))
+    book.close()
+
+    # moves of fewer than min_games games are left out
+    self.assertEqual(build(self.path, games, min_games=2), 1)
+
+  def test_self_play(self):
+    entries = build(self.path, self_play_games(30, seed=5, processes=1), max_plies=6)
+    book = OpeningBook(self.path)
+    self.assertEqual(len(book), entries)
+    game = new_game()
+    moves = book.moves(game)
+    self.assertGreater(len(moves), 0)
+    self.assertLessEqual(sum(m[2] for m in moves), 30)
+    # the engine plays the most played book move without searching
+    engine = SearchEngine(book=book)
+    self.assertEqual(engine.search(game, 0.1), moves[0][:2])
+    self.assertEqual(engine.nodes, 0)
+
+  def test_recorded_games(self):
+    paths = []
+    for seed in range(3):
+      path = os.path.join(self.directory, "game%d.log" % seed)
+      recorded = RecordedGame(new_game(), path)
+      rng = random.Random(seed)
+      for _ in range(10):
+        start, destination, _ = rng.choice(recorded.legal_moves())
+        recorded.play_game(recorded.players[recorded.player_to_move_index].player_name, start, destination)
+      recorded.close()
+      paths += [path]
+    games = list(recorded_games(paths))
+    self.assertEqual(len(games), 3)
+    self.assertEqual(len(games[0][0]), 10)
+    build(self.path, games, min_games=1)
+    self.assertEqual(sum(m[2] for m in OpeningBook(self.path).moves(Checkers())), 3)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,240 @@
+# Author: Biereagu Sochima
+# GitHub username: kodejuice
+# Date: 18/10/2026
+# Description: Alpha-beta search engine playing the Checkers game
+
+# CheckersEngine.py
+
+import time
+
+from CheckersGame import BLACK, WHITE, MAN, KING, TRIPLE_KING, SQUARE_COORDS
+from CheckersTablebase import WIN as TABLEBASE_WIN, LOSS as TABLEBASE_LOSS
+from CheckersSharedTT import EXACT, LOWER, UPPER
+
+WIN_SCORE = 100000
+INFINITY = WIN_SCORE + 1
+# Scores this close to WIN_SCORE are wins or losses found at a distance from the root,
+# the transposition table keeps them relative to the position instead
+MATE_SCORE = WIN_SCORE - 1024
+
+# Material value of a man, king and triple king
+PIECE_VALUES = (100, 250, 400)
+# Bonus per row a man has advanced towards its promotion row
+ADVANCE_BONUS = 4
+
+# ROW_MASKS[row] is the mask of the squares of a board row
+ROW_MASKS = tuple(
+    sum(1 << square for square, coord in enumerate(SQUARE_COORDS) if coord[0] == row) for row in range(8))
+
+
+class SearchTimeout(Exception):
+  """Raised inside the search when the time budget of a move is used up"""
+  pass
+
+
+def evaluate(game, side):
+  """Return the static score of the position for given side, positive if side is better"""
+  bitboards = game._bitboards
+  score = 0
+  for color, sign in ((BLACK, 1), (WHITE, -1)):
+    for rank in (MAN, KING, TRIPLE_KING):
+      score += sign * PIECE_VALUES[rank] * bitboards[color * 3 + rank].bit_count()
+  black_men, white_men = bitboards[BLACK * 3 + MAN], bitboards[WHITE * 3 + MAN]
+  for row in range(8):
+    # black men advance towards row 0, white men towards row 7
+    score += ADVANCE_BONUS * ((7 - row) * (black_men & ROW_MASKS[row]).bit_count()
+                              - row * (white_men & ROW_MASKS[row]).bit_count())
+  return score if side == BLACK else -score
+
+
+def _score_to_tt(score, ply):
+  """Return a score of the search at ply as stored in the transposition table"""
+  if score >= MATE_SCORE:
+    return score + ply
+  if score <= -MATE_SCORE:
+    return score - ply
+  return score
+
+
+def _score_from_tt(score, ply):
+  """Return a score of the transposition table as seen by the search at ply"""
+  if score >= MATE_SCORE:
+    return score - ply
+  if score <= -MATE_SCORE:
+    return score + ply
+  return score
+
+
+class SearchEngine:
+  """Negamax alpha-beta search with iterative deepening.
+  Moves are ordered captures first, then by killer moves and the history heuristic.
+  The search stops when the time budget of the move is used up and returns the best move
+  of the last finished depth. Positions found in the tablebase, if one is given, are not searched,
+  and the most played move of the opening book, if one is given, is played without searching.
+  Results are kept in the transposition table tt (a SharedTranspositionTable), if one is given,
+  which engines of other processes can share"""
+
+  def __init__(self, max_depth=64, check_interval=64, tablebase=None, book=None, tt=None):
+    self.max_depth = max_depth
+    self.check_interval = check_interval
+    self.tablebase = tablebase
+    self.book = book
+    self.tt = tt
+    self.nodes = 0
+    self.depth = 0
+    self.score = 0
+    self._deadline = None
+    self._killers = []
+    self._history = {}
+
+  def search(self, game, time_limit=1.0, max_depth=None):
+    """Return the best (start, destination) move of the player to move, found within time_limit seconds.
+    Returns None if the player has no move. The game is left unchanged"""
+    self._deadline = time.perf_counter() + time_limit
+    self._killers = [[None, None] for _ in range(128)]
+    self._history = {}
+    self.nodes = 0
+    self.depth = 0
+    self.score = 0
+
+    moves = game.legal_moves()
+    if not moves:
+      return None
+    if self.book is not None:
+      book_moves = self.book.moves(game)
+      if book_moves:
+        return book_moves[0][0], book_moves[0][1]
+    best = moves[0]
+    if len(moves) == 1:
+      return best[0], best[1]
+
+    saved = game.snapshot()
+    for depth in range(1, (max_depth or self.max_depth) + 1):
+      try:
+        score, move = self._search_root(game, moves, depth, best)
+      except SearchTimeout:
+        game.restore(saved)
+        break
+      best, self.score, self.depth = move, score, depth
+      if abs(score) >= WIN_SCORE - 128:
+        # forced win or loss found, deeper searches will not change it
+        break
+    return best[0], best[1]
+
+  def play(self, game, time_limit=1.0):
+    """Search and play the best move for the player to move with play_game.
+    Returns the number of captured pieces, None if the player has no move"""
+    move = self.search(game, time_limit)
+    if move is None:
+      return None
+    player = game.players[game.player_to_move_index]
+    return game.play_game(player.player_name, move[0], move[1])
+
+  def _search_root(self, game, moves, depth, best):
+    """Search all root moves to given depth, the best move of the previous depth first"""
+    moves = self._order(moves, 0)
+    moves.remove(best)
+    moves.insert(0, best)
+    alpha, beta = -INFINITY, INFINITY
+    best_move = best
+    for move in moves:
+      score = self._search_move(game, move, depth, alpha, beta, 0)
+      if score > alpha:
+        alpha, best_move = score, move
+    return alpha, best_move
+
+  def _search_move(self, game, move, depth, alpha, beta, ply):
+    """Play move, search the position after it and undo it. Returns the score for the player who moved"""
+    side = game.player_to_move_index
+    token = game.make_move(move[0], move[1])
+    if game.player_to_move_index == side:
+      # the capture goes on, same player, same depth
+      score = self._negamax(game, depth, alpha, beta, ply + 1)
+    else:
+      score = -self._negamax(game, depth - 1, -beta, -alpha, ply + 1)
+    game.unmake_move(token)
+    return score
+
+  def _negamax(self, game, depth, alpha, beta, ply):
+    """Return the score of the position for the player to move"""
+    self.nodes += 1
+    if self.nodes % self.check_interval == 0 and time.perf_counter() > self._deadline:
+      raise SearchTimeout()
+
+    if self.tablebase is not None:
+      value = self.tablebase.probe(game)
+      if value is not None:
+        result, distance = value
+        if result == TABLEBASE_WIN:
+          return WIN_SCORE - ply - distance
+        return -WIN_SCORE + ply + distance if result == TABLEBASE_LOSS else 0
+
+    tt_move = None
+    if self.tt is not None:
+      key = game.position_hash()
+      entry = self.tt.probe(key)
+      if entry is not None:
+        tt_move, tt_depth, score, bound = entry
+        if tt_depth >= depth:
+          score = _score_from_tt(score, ply)
+          if bound == EXACT or (bound == LOWER and score >= beta) or (bound == UPPER and score <= alpha):
+            return score
+
+    side = game.player_to_move_index
+    moves = game.legal_moves()
+    if not moves:
+      # the player to move has lost, prefer the longest defence and the fastest win
+      return -WIN_SCORE + ply
+    if depth <= 0 and moves[0][2] == 0:
+      # quiet position at the horizon, captures are always searched out
+      return evaluate(game, side)
+
+    moves = self._order(moves, ply)
+    if tt_move is not None:
+      for i, move in enumerate(moves):
+        if (move[0], move[1]) == tt_move:
+          moves.insert(0, moves.pop(i))
+          break
+
+    best, best_move, alpha_start = -INFINITY, None, alpha
+    for move in moves:
+      score = self._search_move(game, move, depth, alpha, beta, ply)
+      if score > best:
+        best, best_move = score, move
+      if score > alpha:
+        alpha = score
+      if alpha >= beta:
+        if move[2] == 0:
+          self._store_cutoff(move, depth, ply)
+        break
+
+    if self.tt is not None:
+      bound = UPPER if best <= alpha_start else LOWER if best >= beta else EXACT
+      self.tt.store(key, (best_move[0], best_move[1]), depth, _score_to_tt(best, ply), bound)
+    return best
+
+  def _order(self, moves, ply):
+    """Return moves sorted captures first, then killer moves, then by history score"""
+    killers = self._killers[ply] if ply < len(self._killers) else (None, None)
+    history = self._history
+
+    def key(move):
+      if move[2] > 0:
+        return 1 << 40 | move[2]
+      if move == killers[0]:
+        return 1 << 39
+      if move == killers[1]:
+        return 1 << 38
+      return history.get((move[0], move[1]), 0)
+
+    return sorted(moves, key=key, reverse=True)
+
+  def _store_cutoff(self, move, depth, ply):
+    """Remember a quiet move that caused a beta cutoff"""
+    if ply < len(self._killers):
+      killers = self._killers[ply]
+      if killers[0] != move:
+        killers[1] = killers[0]
+        killers[0] = move
+    key = (move[0], move[1])
+    self._history[key] = self._history.get(key, 0) + depth * depth
@@ -0,0 +1,69 @@
+import time
+import unittest
+from CheckersEngine import *
+from CheckersGame import new_game
+from CheckersPerft import POSITIONS
+
+
+class TestCheckersEngine(unittest.TestCase):
+  def setUp(self):
+    self.engine = SearchEngine()
+
+  def test_returns_legal_move(self):
+    game = new_game()
+    move = self.engine.search(game, 0.2, max_depth=3)
+    legal = [(m[0], m[1]) for m in game._get_player_moves(game.player_to_move_index)]
+    self.assertIn(move, legal)
+    self.assertEqual(self.engine.depth, 3)
+
+  def test_game_is_unchanged(self):
+    game = new_game(POSITIONS["friendly_jump"])
+    board, key = game.board, game.position_hash()
+    self.engine.search(game, 0.2, max_depth=4)
+    self.assertEqual(game.board, board)
+    self.assertEqual(game.position_hash(), key)
+    self.assertEqual(game.player_to_move_index, BLACK)
+
+  def test_time_budget(self):
+    # search of the start position is cut off close to the deadline
+    game = new_game()
+    board = game.board
+    begin = time.perf_counter()
+    move = self.engine.search(game, 0.1)
+    self.assertLess(time.perf_counter() - begin, 0.5)
+    self.assertIsNotNone(move)
+    self.assertEqual(game.board, board)
+    self.assertEqual(game.players[BLACK].get_captured_pieces_count(), 0)
+
+  def test_finds_winning_capture(self):
+    # black king captures the last white piece
+    game = new_game([
+        "-  -  -  -  -  -  -  - ",
+        "-  -  -  -  -  -  -  - ",
+        "-  -  -  -  -  -  -  - ",
+        "-  -  -  -  -  -  -  - ",
+        "-  -  -  -  -  -  -  - ",
+        "-  W  -  -  -  -  -  - ",
+        "-  -  -  -  -  -  -  - ",
+        "-  -  -  Bk -  -  -  B ",
+    ])
+    self.assertEqual(self.engine.search(game, 0.5), ((7, 3), (4, 0)))
+    self.assertEqual(self.engine.play(game, 0.5), 1)
+    self.assertEqual(game.game_winner(), "Black")
+
+  def test_no_move(self):
+    game = new_game([
+        "-  -  -  -  -  -  -  - ",
+        "-  -  -  -  -  -  -  - ",
+        "-  -  -  -  -  -  -  - ",
+        "W  -  -  -  W  -  -  - ",
+        "-  W  -  W  -  -  -  - ",
+        "-  -  B  -  -  -  -  - ",
+        "-  -  -  -  -  -  -  - ",
+        "-  -  -  -  -  -  -  - ",
+    ])
+    self.assertIsNone(self.engine.search(game, 0.1))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -5,6 +5,13 @@
 
 # CheckersGame.py
 
+import random
+import struct
+import threading
+import time
+from collections import OrderedDict
+from enum import IntEnum
+
 # Error classes
 class OutofTurn(Exception):
   """Raised when a player attempts to move a piece out of turn"""
@@ -24,10 +31,185 @@ class InvalidPlayer(Exception):
 BLACK = 0
 WHITE = 1
 
+# Piece ranks
+MAN = 0
+KING = 1
+TRIPLE_KING = 2
+
+
+class Piece(IntEnum):
+  """The pieces of the game. A piece is its code (color * 3 + rank), each code owns one bitboard in Checkers.
+  color, rank and label (the name used on the board) are set once per piece"""
+
+  def __new__(cls, code, label):
+    piece = int.__new__(cls, code)
+    piece._value_ = code
+    piece.color, piece.rank = divmod(code, 3)
+    piece.label = label
+    return piece
+
+  def __str__(self):
+    return self.label
+
+  BLACK = (0, "Black")
+  BLACK_KING = (1, "Black_king")
+  BLACK_TRIPLE_KING = (2, "Black_Triple_King")
+  WHITE = (3, "White")
+  WHITE_KING = (4, "White_king")
+  WHITE_TRIPLE_KING = (5, "White_Triple_King")
+
+
+# PIECES[code] is the Piece of a code and PIECE_NAMES[code] its name
+PIECES = tuple(Piece)
+PIECE_NAMES = tuple(piece.label for piece in PIECES)
+PIECE_CODES = {name: code for code, name in enumerate(PIECE_NAMES)}
+
+
+# The 32 dark squares ((row + col) odd) the game is played on are indexed row * 4 + col // 2, so a game
+# fits in the low 32 bits of the bitboards. The diagonals of a light square only cross light squares,
+# pieces a board assignment puts on them play apart on squares 32 + row * 4 + col // 2.
+# SQUARE_COORDS maps an index back to its (row, col) tuple, SQUARE_INDEX a (row, col) tuple to its index
+# and SQUARE_ROWS an index to its row
+SQUARES = 64
+DARK_SQUARES = 32
+SQUARE_COORDS = tuple((row, col) for parity in (1, 0) for row in range(8) for col in range(8)
+                      if (row + col) % 2 == parity)
+SQUARE_INDEX = {coord: square for square, coord in enumerate(SQUARE_COORDS)}
+SQUARE_ROWS = tuple(row for row, _ in SQUARE_COORDS)
+
+# Diagonal directions as (row step, col step)
+TOP_LEFT, TOP_RIGHT, BOTTOM_LEFT, BOTTOM_RIGHT = range(4)
+DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+def _build_ray_tables():
+  """Return the diagonal rays of every square and the masks of the squares between two squares of a diagonal"""
+  rays = []
+  between = [0] * (SQUARES * SQUARES)
+  for square in range(SQUARES):
+    row, col = SQUARE_COORDS[square]
+    square_rays = []
+    for dx, dy in DIRECTIONS:
+      ray = []
+      r, c = row + dx, col + dy
+      mask = 0
+      while 0 <= r <= 7 and 0 <= c <= 7:
+        other = SQUARE_INDEX[(r, c)]
+        ray += [other]
+        between[square * SQUARES + other] = mask
+        mask |= 1 << other
+        r, c = r + dx, c + dy
+      square_rays += [tuple(ray)]
+    rays += [tuple(square_rays)]
+  return tuple(rays), tuple(between)
+
+
+# RAYS[square][direction] is the tuple of squares along that diagonal, nearest first.
+# BETWEEN[start * SQUARES + stop] is the mask of the squares strictly between two squares of a diagonal
+RAYS, BETWEEN = _build_ray_tables()
+
+# RAY_MASKS[square] is the mask of a square and of the squares on its diagonals,
+# the only squares the moves of a piece depend on as long as it cannot capture
+RAY_MASKS = tuple(sum(1 << s for ray in RAYS[square] for s in ray) | 1 << square for square in range(SQUARES))
+
+# STEP_MASKS[color][square] is the mask of the squares a man of that color on the square steps to,
+# STEP_MASKS[2][square] those of a king (all neighbors). Every piece can move if one of them is empty
+STEP_MASKS = tuple(
+    tuple(sum(1 << RAYS[square][d][0] for d in directions if RAYS[square][d]) for square in range(SQUARES))
+    for directions in ((TOP_LEFT, TOP_RIGHT), (BOTTOM_LEFT, BOTTOM_RIGHT), range(4)))
+
+
+# Zobrist keys, ZOBRIST_KEYS[code * SQUARES + square] for a piece on a square,
+# ZOBRIST_WHITE_TO_MOVE is mixed into position_hash() when white is to move
+_zobrist_random = random.Random(162)
+ZOBRIST_KEYS = tuple(_zobrist_random.getrandbits(64) for _ in range(len(PIECE_NAMES) * SQUARES))
+ZOBRIST_WHITE_TO_MOVE = _zobrist_random.getrandbits(64)
+
+# The rules do not change when the colors are swapped and the board is turned half a turn, so a position
+# with white to move is equivalent to its ROTATED position with black to move. (Mirroring or flipping the board
+# alone would move the pieces to the light squares.) ROTATED maps every square and every move back to itself
+IDENTITY, ROTATED = 0, 1
+# Piece code of the same rank in the other color
+SWAPPED_CODES = tuple((code + 3) % len(PIECE_NAMES) for code in range(len(PIECE_NAMES)))
+# ZOBRIST_ROTATED[code * SQUARES + square] is the key the piece has in the rotated position
+ZOBRIST_ROTATED = tuple(ZOBRIST_KEYS[SWAPPED_CODES[code] * SQUARES + SQUARE_INDEX[(7 - row, 7 - col)]]
+                        for code in range(len(PIECE_NAMES)) for row, col in SQUARE_COORDS)
+
+
+def _reverse_bits(mask):
+  """Return the 32 bit mask with its bits in reverse order"""
+  return int(format(mask, "032b")[::-1], 2)
+
+
+def rotate_bitboards(bitboards):
+  """Return the bitboards of the position with the colors swapped and the board turned half a turn.
+  Turning the board maps square index i of the dark squares (or of the light squares) to 31 - i"""
+  rotated = [0] * len(bitboards)
+  for code, mask in enumerate(bitboards):
+    if mask:
+      rotated[SWAPPED_CODES[code]] = _reverse_bits(mask & 0xFFFFFFFF) | _reverse_bits(mask >> DARK_SQUARES) << DARK_SQUARES
+  return rotated
+
+
+def transform_square(square, transform):
+  """Return the (row, col) square the transform of canonical_position maps square to, and back"""
+  return (7 - square[0], 7 - square[1]) if transform == ROTATED else tuple(square)
+
+
+def _piece_code(piece):
+  """Return the piece code of a Piece or of a piece name as used in Checkers.board"""
+  if isinstance(piece, int):
+    return int(piece)
+  code = PIECE_CODES.get(piece)
+  if code is None:
+    # fall back to the loose spelling rules the board strings were always checked with
+    piece = piece.lower()
+    color = BLACK if 'black' in piece else WHITE
+    if 'triple' in piece:
+      rank = TRIPLE_KING
+    elif 'ing' in piece:
+      rank = KING
+    else:
+      rank = MAN
+    code = color * 3 + rank
+  return code
+
+
+# Tokens of the short board layout used in tests and tools, e.g. ['-', 'B', '-', 'Wk', ...]
+LAYOUT_TOKENS = {'-': None, 'b': "Black", 'bk': "Black_king", 'b*': "Black_Triple_King",
+                 'w': "White", 'wk': "White_king", 'w*': "White_Triple_King"}
+
+
+def parse_layout(layout):
+  """Return a board (list of lists of piece names) from a layout of 8 rows of layout tokens.
+  A row may be a list of tokens or a string of whitespace separated tokens"""
+  board = []
+  for row in layout:
+    if isinstance(row, str):
+      row = row.split()
+    board += [[LAYOUT_TOKENS[token.lower()] for token in row]]
+  return board
+
+
+# Letters of the compact position string (Checkers.to_string) by piece code, lower case for men,
+# upper case for kings and a '*' after the king letter for triple kings
+POSITION_LETTERS = ("b", "B", "B*", "w", "W", "W*")
+POSITION_CODES = {letter: code for code, letter in enumerate(POSITION_LETTERS)}
+# Square index of every row * 8 + col
+BOARD_SQUARES = tuple(SQUARE_INDEX[divmod(i, 8)] for i in range(64))
+
+# Packed position (Checkers.to_bytes): the six bitboards restricted to the 32 dark squares,
+# the player to move, and the king, triple king and captured pieces counts of black then white.
+# 3 bits a square would take 19 bytes, but the masks unpack straight into the bitboards with one call
+PACKED_POSITION = struct.Struct("<6IB6b")
+DARK_MASK = (1 << DARK_SQUARES) - 1
+
 
 class Player:
   """Represents the player in the game. It is initialized with player_name and checker_color that the player has chosen"""
 
+  __slots__ = ("player_name", "checker_color", "king_count", "triple_king_count", "captured_pieces_count")
+
   def __init__(self, player_name, checker_color):
     self.player_name = player_name
     self.checker_color = checker_color
@@ -60,37 +242,274 @@ class Player:
     self.captured_pieces_count += amount
 
 
+class CaptureCache:
+  """Bounded least recently used cache of max-capture search results.
+  Entries are keyed by the position (the piece bitboards) plus the square of the capturing piece.
+  The cache is shared by all games, a lock lets games of several threads use it"""
+
+  def __init__(self, maxsize=100000):
+    self.maxsize = maxsize
+    self.hits = 0
+    self.misses = 0
+    self._entries = OrderedDict()
+    self._lock = threading.Lock()
+
+  def __len__(self):
+    return len(self._entries)
+
+  def get(self, key):
+    """Return the cached result for key, None if it is not cached"""
+    with self._lock:
+      # taken out and put back at the end, as the most recently used
+      result = self._entries.pop(key, None)
+      if result is None:
+        self.misses += 1
+      else:
+        self._entries[key] = result
+        self.hits += 1
+    return result
+
+  def put(self, key, result):
+    """Cache result for key, dropping the least recently used entry when the cache is full"""
+    with self._lock:
+      entries = self._entries
+      entries.pop(key, None)
+      entries[key] = result
+      while len(entries) > self.maxsize:
+        entries.popitem(last=False)
+
+  def clear(self):
+    """Remove all entries and reset the statistics"""
+    with self._lock:
+      self._entries.clear()
+      self.hits = 0
+      self.misses = 0
+
+  def stats(self):
+    """Return the hit/miss statistics of the cache as a dict"""
+    lookups = self.hits + self.misses
+    return {
+        "hits": self.hits,
+        "misses": self.misses,
+        "hit_rate": self.hits / lookups if lookups else 0.0,
+        "size": len(self._entries),
+        "maxsize": self.maxsize,
+    }
+
+
+def _phase_timer(profile, phase, method):
+  """Return method wrapped to count its calls and time in the profile phase"""
+  calls, seconds, clock = profile.calls, profile.seconds, time.perf_counter
+
+  def timed(*args):
+    calls[phase] += 1
+    begin = clock()
+    try:
+      return method(*args)
+    finally:
+      seconds[phase] += clock() - begin
+  return timed
+
+
+def _capture_search_timer(profile, method):
+  """Return the capture search wrapped to count its calls and measure its recursion depth,
+  it is timed once per outermost call"""
+  calls, seconds, clock = profile.calls, profile.seconds, time.perf_counter
+
+  def timed(square):
+    calls["capture_search"] += 1
+    profile.capture_depth += 1
+    if profile.capture_depth > 1:
+      profile.last_capture_depth = max(profile.last_capture_depth, profile.capture_depth)
+      try:
+        return method(square)
+      finally:
+        profile.capture_depth -= 1
+    profile.last_capture_depth = 1
+    begin = clock()
+    try:
+      return method(square)
+    finally:
+      seconds["capture_search"] += clock() - begin
+      profile.capture_depth = 0
+      profile.max_capture_depth = max(profile.max_capture_depth, profile.last_capture_depth)
+  return timed
+
+
+# Phases timed by the profiler and the method of each phase
+PROFILED_PHASES = (
+    ("move_generation", "_get_player_moves"),
+    ("square_moves", "_generate_moves"),
+    ("capture_search", "_max_capture_moves"),
+    ("move_application", "_move_piece"),
+    ("move_undo", "_unmove_piece"),
+    ("winner_check", "game_winner"),
+    ("play_game", "play_game"),
+)
+
+
+class GameProfile:
+  """Call counts and times of the phases of a game, filled while its profiling is enabled.
+  Times include the nested phases, a capture search is timed once per outermost call"""
+
+  def __init__(self):
+    self.reset()
+
+  def reset(self):
+    self.calls = dict.fromkeys((phase for phase, _ in PROFILED_PHASES), 0)
+    self.seconds = dict.fromkeys(self.calls, 0.0)
+    self.capture_depth = 0
+    self.last_capture_depth = 0
+    self.max_capture_depth = 0
+
+  def as_dict(self):
+    stats = {phase: {"calls": self.calls[phase], "seconds": self.seconds[phase]} for phase in self.calls}
+    stats["last_capture_depth"] = self.last_capture_depth
+    stats["max_capture_depth"] = self.max_capture_depth
+    return stats
+
+
+class _BoardRow(list):
+  """A row of the list returned by Checkers.board, setting a square of the row sets it on the game.
+  Copies and pickles of the row are plain lists"""
+
+  def __init__(self, game, row, pieces):
+    super().__init__(pieces)
+    self._game = game
+    self._row = row
+
+  def __setitem__(self, col, piece):
+    super().__setitem__(col, piece)
+    cols = range(8)[col]
+    if isinstance(col, slice):
+      self._game._set_squares([((self._row, c), self[c]) for c in cols])
+    else:
+      self._game._set_squares([((self._row, cols), piece)])
+
+  def __reduce__(self):
+    return list, (list(self),)
+
+
+class _Board(list):
+  """The list returned by Checkers.board, its rows write through to the game.
+  Copies and pickles of the board are plain lists of lists"""
+
+  def __init__(self, game, rows):
+    super().__init__(_BoardRow(game, row, pieces) for row, pieces in enumerate(rows))
+    self._game = game
+
+  def __setitem__(self, row, pieces):
+    pieces = _BoardRow(self._game, row, pieces)
+    super().__setitem__(row, pieces)
+    self._game._set_squares([((row, col), pieces[col]) for col in range(8)])
+
+  def __reduce__(self):
+    return list, ([list(row) for row in self],)
+
+
 class Checkers:
   """The Checkers object represents the game as played.
   The class should contain information about the board and the players"""
 
+  # Max-capture results only depend on the position, so all games share one cache by default
+  capture_cache = CaptureCache()
+
   def __init__(self):
-    # Initializing the board
-    self.board = [[None for _ in range(8)] for _ in range(8)]
+    # Initializing the board, one bitboard (bit = square index) per piece code
+    self._bitboards = [0] * len(PIECE_NAMES)
+    board = [[None for _ in range(8)] for _ in range(8)]
     # Initialize players
     self.players = [None, None]
     self.player_to_move_index = 0
+    # GameProfile of the last enable_profiling call
+    self.profile = None
     # Setting up the pieces for player 1
     for row in range(3):
       for col in range(8):
         if row % 2 == 0:
           if col % 2 == 1:
-            self.board[row][col] = "White"
+            board[row][col] = "White"
         else:
           if col % 2 == 0:
-            self.board[row][col] = "White"
+            board[row][col] = "White"
     # Setting up the pieces for player 2
     for row in range(5, 8):
       for col in range(8):
         if row % 2 == 0:
           if col % 2 == 1:
-            self.board[row][col] = "Black"
+            board[row][col] = "Black"
         else:
           if col % 2 == 0:
-            self.board[row][col] = "Black"
+            board[row][col] = "Black"
+    self.board = board
+
+  @property
+  def board(self):
+    """The board as a list of lists holding the piece name of every square (None if empty).
+    The list is built from the bitboards on every access. Setting a square or a row of it,
+    e.g. game.board[7][0] = "Black", sets it on the game, as does assigning a whole board"""
+    board = [[None for _ in range(8)] for _ in range(8)]
+    for code, mask in enumerate(self._bitboards):
+      name = PIECE_NAMES[code]
+      while mask:
+        bit = mask & -mask
+        mask ^= bit
+        row, col = SQUARE_COORDS[bit.bit_length() - 1]
+        board[row][col] = name
+    return _Board(self, board)
+
+  @board.setter
+  def board(self, board):
+    bitboards = [0] * len(PIECE_NAMES)
+    for row in range(8):
+      for col in range(8):
+        piece = board[row][col]
+        # Piece.BLACK is 0, only None is an empty square
+        if piece is not None:
+          bitboards[_piece_code(piece)] |= 1 << SQUARE_INDEX[(row, col)]
+    self._set_bitboards(bitboards)
+
+  def _set_squares(self, pieces):
+    """Put the pieces of [((row, col), piece name), ...] on their squares (None empties a square),
+    the other squares are left as they are"""
+    bitboards = list(self._bitboards)
+    for square, piece in pieces:
+      bit = 1 << SQUARE_INDEX[square]
+      for code in range(len(bitboards)):
+        bitboards[code] &= ~bit
+      if piece is not None:
+        bitboards[_piece_code(piece)] |= bit
+    self._set_bitboards(bitboards)
+
+  def position_hash(self):
+    """Returns the 64-bit Zobrist key of the current position, including the player to move"""
+    if self.player_to_move_index == WHITE:
+      return self._hash ^ ZOBRIST_WHITE_TO_MOVE
+    return self._hash
+
+  def canonical_position(self):
+    """Returns (bitboards, transform) of the canonical position equivalent to the game position, which always has
+    black to move: the position itself (IDENTITY) if black is to move, else the ROTATED position.
+    Moves of the canonical position map back to the game with transform_square(square, transform)"""
+    if self.player_to_move_index == BLACK:
+      return list(self._bitboards), IDENTITY
+    return rotate_bitboards(self._bitboards), ROTATED
+
+  def canonical_hash(self):
+    """Returns (key, transform), key being the Zobrist key of the canonical position (see canonical_position).
+    Equivalent positions have the same key, which caches and tables can store instead of position_hash()"""
+    if self.player_to_move_index == BLACK:
+      return self._hash, IDENTITY
+    key = 0
+    for code, mask in enumerate(self._bitboards):
+      while mask:
+        bit = mask & -mask
+        mask ^= bit
+        key ^= ZOBRIST_ROTATED[code * SQUARES + bit.bit_length() - 1]
+    return key, ROTATED
 
   def print_board(self):
-    """Print the game board"""
+    """Print the game board. Squares set on game.board (game.board[row][col] = piece) change the game"""
     print(self.board)
 
   def create_player(self, player_name, piece_color):
@@ -115,23 +534,35 @@ class Checkers:
       If white king piece is present return "White_king".
       If black triple king piece is present return "Black_Triple_King".
       If white triple king piece is present return "White_Triple_King"""
-    row, col = square_location
-    if not self._in_bound((row, col)):
+    if not self._in_bound(square_location):
       raise InvalidSquare("Invalid square entered.")
-    return self.board[row][col]
+    code = self._piece_at(SQUARE_INDEX[tuple(square_location)])
+    return None if code is None else PIECE_NAMES[code]
 
   def play_game(self, player_name, start, destination):
     """Makes a move with the given player_name, starting_square_location and destination_square_location of the piece
     The square_location is a tuple in format (x,y)
+    destination may also be a list of square_locations, the path of a whole multiple capture (see get_capture_paths),
+    which is validated before any hop is played and then played at once, the turn goes to the next player
     If a player attempts to move a piece out of turn, raise an OutofTurn exception
     If the player_name is not valid, raise an InvalidPlayer exception
     If a player does not own the checker present in the square_location or if the square_location does not exist on the baord; raise an InvalidSquare exception
     This method returns the number of captured pieces, if any, otherwise return 0
     If the destination piece reaches the end of opponent's side it is promoted as a king on the board. If the piece crosses back to its original side it becomes a triple king"""
 
+    path = None
+    if isinstance(destination, list):
+      if not destination:
+        raise InvalidSquare("Invalid move.")
+      path, destination = destination, destination[-1]
+
     # Check if the start and destination squares are valid
     if not self._in_bound(start) or not self._in_bound(destination):
       raise InvalidSquare("Square location is not valid.")
+    if path is not None:
+      if not all(self._in_bound(square) for square in path):
+        raise InvalidSquare("Square location is not valid.")
+      destination = tuple(destination)
 
     player_names = [(p.player_name if p else None) for p in self.players]
     if player_name not in player_names:
@@ -143,11 +574,14 @@ class Checkers:
 
     player = self.players[self.player_to_move_index]
 
-    piece = self.get_checker_details(start)
-    if piece == None or player.checker_color.lower() not in piece.lower():
+    code = self._piece_at(SQUARE_INDEX[tuple(start)])
+    if code is None or PIECES[code].color != self.player_to_move_index:
       raise InvalidSquare(
           "Player does not own the checker present at the given square location.")
 
+    if path is not None and (len(path) > 1 or self.get_capture_paths(start)):
+      return self._play_capture_path(start, path)
+
     # Get all valid moves for the given start location
     valid_moves = self._get_legal_moves(start)
 
@@ -178,9 +612,28 @@ class Checkers:
 
     return capture_count
 
+  def get_capture_paths(self, square_location):
+    """Returns every capture sequence the piece on square_location can play as a list of paths, a path being
+    the list of squares the piece lands on hop after hop, e.g. [[(3, 2), (1, 4)], ...].
+    Only the sequences capturing the most pieces are listed, [] if the piece cannot capture"""
+    if not self._in_bound(square_location):
+      raise InvalidSquare("Invalid square entered.")
+    square = SQUARE_INDEX[tuple(square_location)]
+    code = self._piece_at(square)
+    if code is None:
+      return []
+    # the hops are played for the owner of the piece, whose counters they update and restore
+    side, self.player_to_move_index = self.player_to_move_index, code // 3
+    try:
+      paths = self._capture_paths(square)
+    finally:
+      self.player_to_move_index = side
+    return [[SQUARE_COORDS[hop] for hop in path] for path in paths if path]
+
   def game_winner(self):
-    p1_moves = self._get_player_moves(BLACK)
-    p2_moves = self._get_player_moves(WHITE)
+    """Returns the name of the player who won the game, "Game has not ended" if both players can move"""
+    p1_moves = self._has_legal_move(BLACK)
+    p2_moves = self._has_legal_move(WHITE)
     if p1_moves and p2_moves:
       return "Game has not ended"
 
@@ -198,106 +651,405 @@ class Checkers:
     if p2_moves:
       return self.players[WHITE].player_name
 
+  def enable_profiling(self, callback=None):
+    """Starts counting and timing the phases of the game, returns the GameProfile being filled.
+    callback, if given, is called with the profile as a dict after every play_game.
+    The profiled methods are wrapped on this game only, other games and a disabled profile cost nothing"""
+    self.disable_profiling()
+    profile = GameProfile()
+    for phase, name in PROFILED_PHASES:
+      method = getattr(type(self), name).__get__(self)
+      if phase == "capture_search":
+        wrapper = _capture_search_timer(profile, method)
+      else:
+        wrapper = _phase_timer(profile, phase, method)
+      setattr(self, name, wrapper)
+    if callback is not None:
+      play_game = self.play_game
+
+      def report(*args):
+        result = play_game(*args)
+        callback(profile.as_dict())
+        return result
+      self.play_game = report
+    self.profile = profile
+    return profile
+
+  def disable_profiling(self):
+    """Stops profiling and removes the wrappers, the last profile stays readable in profile_stats"""
+    for _, name in PROFILED_PHASES:
+      self.__dict__.pop(name, None)
+
+  def profile_stats(self):
+    """Returns the counters and timers of the profile as a dict, None if profiling was never enabled"""
+    return self.profile.as_dict() if self.profile else None
+
+  def legal_moves(self):
+    """Returns the legal moves of the player to move as [(start, destination, capture_count), ...]"""
+    return self._get_player_moves(self.player_to_move_index)
+
+  def make_move(self, start, destination):
+    """Plays a move of the player to move without validating it, for searches looking ahead.
+    The player keeps the turn after a capture if the piece can capture again, as in play_game.
+    Returns an undo token to pass to unmake_move, which restores the board, the turn and the player counters"""
+    side = self.player_to_move_index
+    start, destination = SQUARE_INDEX[tuple(start)], SQUARE_INDEX[tuple(destination)]
+    is_capture = BETWEEN[start * SQUARES + destination] & self._color_mask(1 - side) != 0
+    captured, promoted = self._move_piece(start, destination, is_capture)
+    changed = (1 << start) | (1 << destination)
+    for square, _ in captured:
+      changed |= 1 << square
+    self._invalidate_moves(changed)
+    if not captured or not self._can_capture(destination):
+      self.player_to_move_index = 1 - side
+    return start, destination, captured, promoted, side
+
+  def unmake_move(self, token):
+    """Takes back the move make_move returned the undo token of, moves must be unmade in reverse order"""
+    start, destination, captured, promoted, side = token
+    self.player_to_move_index = side
+    self._unmove_piece(start, destination, captured, promoted)
+    changed = (1 << start) | (1 << destination)
+    for square, _ in captured:
+      changed |= 1 << square
+    self._invalidate_moves(changed)
+
+  def snapshot(self):
+    """Returns a copy of the game state (position, player to move and player counters) for restore"""
+    counters = tuple((p.king_count, p.triple_king_count, p.captured_pieces_count) if p else None
+                     for p in self.players)
+    return (tuple(self._bitboards), bytes(self._cells), self._hash, tuple(self._piece_counts),
+            self.player_to_move_index, counters)
+
+  def restore(self, snapshot):
+    """Sets the game back to the state returned by snapshot"""
+    bitboards, cells, self._hash, piece_counts, self.player_to_move_index, counters = snapshot
+    self._bitboards = list(bitboards)
+    self._cells[:] = cells
+    self._piece_counts = list(piece_counts)
+    self._cached_squares = 0
+    self._wide_squares = 0
+    for player, counter in zip(self.players, counters):
+      if player and counter:
+        player.king_count, player.triple_king_count, player.captured_pieces_count = counter
+
+  def to_string(self):
+    """Returns the position as a compact string: the rows from row 0 (b/w a man, B/W a king, B*/W* a triple king,
+    a digit for a run of empty squares) separated by '/', the player to move (b or w), then the king,
+    triple king and captured pieces counts of black and of white, e.g.
+    "1w1w1w1w/w1w1w1w1/1w1w1w1w/8/8/b1b1b1b1/1b1b1b1b/b1b1b1b1 b 0,0,0 0,0,0" for the start position"""
+    cells = self._cells
+    rows = []
+    for row in range(0, 64, 8):
+      text, empty = "", 0
+      for square in BOARD_SQUARES[row:row + 8]:
+        if cells[square]:
+          text += (str(empty) if empty else "") + POSITION_LETTERS[cells[square] - 1]
+          empty = 0
+        else:
+          empty += 1
+      rows += [text + (str(empty) if empty else "")]
+    counters = ["%d,%d,%d" % c for c in self._player_counters()]
+    return " ".join(["/".join(rows), "bw"[self.player_to_move_index]] + counters)
+
+  def from_string(self, text):
+    """Sets the position, player to move and player counters from a string returned by to_string.
+    Raises ValueError if the string cannot be read"""
+    parts = text.split()
+    rows = parts[0].split("/") if parts else []
+    if len(parts) != 4 or len(rows) != 8 or parts[1] not in ("b", "w"):
+      raise ValueError("Invalid position string %r" % text)
+    bitboards = [0] * len(PIECE_NAMES)
+    for row, row_text in enumerate(rows):
+      col, i = 0, 0
+      while i < len(row_text) and col < 8:
+        letter = row_text[i]
+        if letter.isdigit():
+          col += int(letter)
+          i += 1
+          continue
+        if row_text[i + 1:i + 2] == "*":
+          letter += "*"
+        code = POSITION_CODES.get(letter)
+        if code is None:
+          raise ValueError("Invalid piece %r in position string" % letter)
+        bitboards[code] |= 1 << BOARD_SQUARES[row * 8 + col]
+        col += 1
+        i += len(letter)
+      if col != 8 or i != len(row_text):
+        raise ValueError("Row %d of the position string does not have 8 squares" % row)
+    try:
+      counters = [tuple(map(int, part.split(","))) for part in parts[2:]]
+    except ValueError:
+      raise ValueError("Invalid player counters in position string")
+    if any(len(c) != 3 for c in counters):
+      raise ValueError("Invalid player counters in position string")
+    self._set_bitboards(bitboards)
+    self.player_to_move_index = BLACK if parts[1] == "b" else WHITE
+    self._set_player_counters(counters)
+
+  def to_bytes(self):
+    """Returns the position, player to move and player counters packed in PACKED_POSITION.size (31) bytes.
+    Only the dark squares are packed, raises ValueError if a piece stands on a light square"""
+    bitboards = self._bitboards
+    if any(mask & ~DARK_MASK for mask in bitboards):
+      raise ValueError("Pieces on light squares cannot be packed")
+    counters = self._player_counters()
+    return PACKED_POSITION.pack(*bitboards, self.player_to_move_index, *counters[BLACK], *counters[WHITE])
+
+  def from_bytes(self, data):
+    """Sets the position, player to move and player counters from bytes returned by to_bytes.
+    Raises ValueError if the bytes cannot be read or two bitboards share a square, the game is then unchanged"""
+    try:
+      values = PACKED_POSITION.unpack(data)
+    except struct.error:
+      raise ValueError("A packed position has %d bytes" % PACKED_POSITION.size)
+    bitboards, counters = list(values[:6]), values[7:]
+    # a 32 bit mask only holds dark squares, but the masks may overlap
+    occupied = 0
+    for mask in bitboards:
+      if mask & occupied:
+        raise ValueError("Packed position puts two pieces on a square")
+      occupied |= mask
+    if values[6] not in (BLACK, WHITE):
+      raise ValueError("Invalid player to move %d in packed position" % values[6])
+    if min(counters) < 0:
+      raise ValueError("Negative player counter in packed position")
+    # the hash and the piece counts are computed again from the bitboards
+    self._set_bitboards(bitboards)
+    self.player_to_move_index = values[6]
+    self._set_player_counters((counters[:3], counters[3:]))
+
   # HELPER Methods
 
+  def _player_counters(self):
+    """Return the (king, triple king, captured pieces) counts of black and white, zeros for a missing player"""
+    return [(p.king_count, p.triple_king_count, p.captured_pieces_count) if p else (0, 0, 0)
+            for p in (self.players[BLACK], self.players[WHITE])]
+
+  def _set_player_counters(self, counters):
+    """Set the counts returned by _player_counters on the players that exist"""
+    for player, counter in zip((self.players[BLACK], self.players[WHITE]), counters):
+      if player:
+        player.king_count, player.triple_king_count, player.captured_pieces_count = counter
+
   def _switch_player_turn(self):
     """Switch play turn to next player"""
     self.player_to_move_index = (self.player_to_move_index + 1) % 2
 
+  def _has_legal_move(self, player_index):
+    """Return True if given player has at least one legal move, stops at the first one found"""
+    if not self._piece_counts[player_index]:
+      return False
+    bitboards = self._bitboards
+    index = player_index * 3
+    empty = ~(self._color_mask(BLACK) | self._color_mask(WHITE))
+    men = bitboards[index]
+    kings = bitboards[index + 1] | bitboards[index + 2]
+
+    # most of the time some piece can simply step forward
+    men_steps, king_steps = STEP_MASKS[player_index], STEP_MASKS[2]
+    pieces = men
+    while pieces:
+      bit = pieces & -pieces
+      pieces ^= bit
+      if men_steps[bit.bit_length() - 1] & empty:
+        return True
+    pieces = kings
+    while pieces:
+      bit = pieces & -pieces
+      pieces ^= bit
+      if king_steps[bit.bit_length() - 1] & empty:
+        return True
+
+    # all pieces are blocked, look for a capture
+    pieces = men | kings
+    while pieces:
+      bit = pieces & -pieces
+      pieces ^= bit
+      if self._generate_moves(bit.bit_length() - 1, False):
+        return True
+    return False
+
   def _get_player_moves(self, player_index):
     """Return the moves of given player"""
-    player = self.players[player_index]
-    color = player.checker_color.lower()
     legal_moves = []
-    for r in range(8):
-      for c in range(8):
-        piece = self.board[r][c]
-        if piece and color in piece.lower():
-          square_moves = self._get_legal_moves((r, c))
-          # [(start, destination, capture_count), ...]
-          square_moves = [((r, c), m[0], m[1]) for m in square_moves]
-          legal_moves += square_moves
+    pieces = self._color_mask(player_index)
+    while pieces:
+      bit = pieces & -pieces
+      pieces ^= bit
+      square = bit.bit_length() - 1
+      start = SQUARE_COORDS[square]
+      # [(start, destination, capture_count), ...]
+      legal_moves += [(start, SQUARE_COORDS[m[0]], m[1]) for m in self._square_moves(square)]
     max_capture_count = max(m[2] for m in legal_moves) if legal_moves else -1
     captures = [m for m in legal_moves if m[2] == max_capture_count]
     return captures or legal_moves
 
   def _get_legal_moves(self, square_location, check_best_capture=True):
     """Return all legal moves from a given square location"""
-    piece = self.get_checker_details(square_location)
-    if not piece:
+    moves = self._square_moves(SQUARE_INDEX[tuple(square_location)], check_best_capture)
+    return [(SQUARE_COORDS[m[0]], m[1]) for m in moves]
+
+  def _get_max_capture_moves(self, square_location):
+    """Return the capture moves that would lead to a maximum capture from given square location"""
+    moves = self._max_capture_moves(SQUARE_INDEX[tuple(square_location)])
+    return [(None if m[0] is None else SQUARE_COORDS[m[0]], m[1]) for m in moves]
+
+  def _play_capture_path(self, start, path):
+    """Play a whole capture sequence of the player to move from start along path, if it is one of the
+    sequences get_capture_paths lists. Returns the number of captured pieces"""
+    if list(map(tuple, path)) not in self.get_capture_paths(start):
+      raise InvalidSquare("Invalid move.")
+    capture_count = 0
+    for destination in path:
+      captures, _ = self._play_move(start, destination, True)
+      capture_count += len(captures)
+      start = destination
+    self._switch_player_turn()
+    return capture_count
+
+  def _capture_paths(self, square):
+    """Return the maximum capture sequences from given square index as lists of square indexes,
+    [[]] if the piece cannot capture"""
+    paths = []
+    for destination, _ in self._max_capture_moves(square):
+      if destination is None:
+        return [[]]
+      captured, promoted = self._move_piece(square, destination, True)
+      paths += [[destination] + path for path in self._capture_paths(destination)]
+      self._unmove_piece(square, destination, captured, promoted)
+    return paths
+
+  def _play_move(self, start, destination, is_capture):
+    """Play a move on the board, move piece at start location to destination and return all pieces captured
+    as [(location, Piece), ...] and the Piece that was promoted (None if there was no promotion)"""
+    start, destination = SQUARE_INDEX[tuple(start)], SQUARE_INDEX[tuple(destination)]
+    captured, promoted = self._move_piece(start, destination, is_capture)
+    changed = (1 << start) | (1 << destination)
+    for square, _ in captured:
+      changed |= 1 << square
+    self._invalidate_moves(changed)
+    captured = [(SQUARE_COORDS[square], PIECES[code]) for square, code in captured]
+    return captured, (None if promoted is None else PIECES[promoted])
+
+  def _undo_play_move(self, start, destination, captured_checkers, promoted):
+    """Undo a played move on the board, return piece from destination to start location
+      and place all captured checkers at their original positions"""
+    start, destination = SQUARE_INDEX[tuple(start)], SQUARE_INDEX[tuple(destination)]
+    changed = (1 << start) | (1 << destination)
+    captured = []
+    for coord, piece in captured_checkers:
+      square = SQUARE_INDEX[tuple(coord)]
+      captured += [(square, _piece_code(piece))]
+      changed |= 1 << square
+    promoted = None if promoted is None else _piece_code(promoted)
+    self._unmove_piece(start, destination, captured, promoted)
+    self._invalidate_moves(changed)
+
+  def _square_moves(self, square, check_best_capture=True):
+    """Return all legal moves from a given square index as [(destination, capture_count), ...].
+    With check_best_capture the moves are kept in the move cache of the square until
+    _play_move or _undo_play_move changes a square they depend on"""
+    if not check_best_capture:
+      return self._generate_moves(square, False)
+    if self._cached_squares >> square & 1:
+      return self._move_cache[square]
+    moves = self._generate_moves(square, True)
+    self._move_cache[square] = moves
+    self._cached_squares |= 1 << square
+    if moves and moves[0][1] > 0:
+      # a capture sequence can leave the diagonals of the square
+      self._wide_squares |= 1 << square
+    return moves
+
+  def _invalidate_moves(self, changed):
+    """Drop the cached moves that depend on the squares of the changed mask"""
+    stale = self._wide_squares
+    while changed:
+      bit = changed & -changed
+      changed ^= bit
+      stale |= RAY_MASKS[bit.bit_length() - 1]
+    self._cached_squares &= ~stale
+    self._wide_squares = 0
+
+  def _generate_moves(self, square, check_best_capture=True):
+    """Generate all legal moves from a given square index as [(destination, capture_count), ...]"""
+    code = self._piece_at(square)
+    if code is None:
       return []
-    top_left_squares = self._diagonal_squares(square_location, -1, -1)
-    top_right_squares = self._diagonal_squares(square_location, -1, 1)
-    bottom_left_squares = self._diagonal_squares(square_location, 1, -1)
-    bottom_right_squares = self._diagonal_squares(square_location, 1, 1)
-
-    if self._is_triple_king(piece):
-      # Triple King
-      color = 'White' if self._is_black_piece(piece) else 'Black'  # opponent
-      top_left = self._get_valid_moves(top_left_squares, color, False, True)
-      top_right = self._get_valid_moves(top_right_squares, color, False, True)
-      bottom_left = self._get_valid_moves(bottom_left_squares, color, 0, 1)
-      bottom_right = self._get_valid_moves(bottom_right_squares, color, 0, 1)
-      moves = top_left + top_right + bottom_left + bottom_right
-
-    elif self._is_king(piece):
-      # King
-      color = 'White' if self._is_black_piece(piece) else 'Black'  # opponent
-      top_left = self._get_valid_moves(top_left_squares, color, False)
-      top_right = self._get_valid_moves(top_right_squares, color, False)
-      bottom_left = self._get_valid_moves(bottom_left_squares, color, False)
-      bottom_right = self._get_valid_moves(bottom_right_squares, color, False)
-      moves = top_left + top_right + bottom_left + bottom_right
-
-    elif self._is_black_piece(piece):
+    color, rank = divmod(code, 3)
+    enemies = self._color_mask(1 - color)
+    occupied = enemies | self._color_mask(color)
+    rays = RAYS[square]
+
+    if rank != MAN:
+      # King or Triple King
+      is_triple = rank == TRIPLE_KING
+      moves = []
+      for ray in rays:
+        moves += self._get_valid_moves(ray, enemies, occupied, False, is_triple)
+
+    elif color == BLACK:
       # Black Piece
-      top_left_moves = self._get_valid_moves(top_left_squares, 'White')
-      top_right_moves = self._get_valid_moves(top_right_squares, 'White')
+      top_left_moves = self._get_valid_moves(rays[TOP_LEFT], enemies, occupied)
+      top_right_moves = self._get_valid_moves(rays[TOP_RIGHT], enemies, occupied)
       moves = top_left_moves + top_right_moves
 
     else:
       # White Piece
-      bottom_left_moves = self._get_valid_moves(bottom_left_squares, 'Black')
-      bottom_right_moves = self._get_valid_moves(bottom_right_squares, 'Black')
+      bottom_left_moves = self._get_valid_moves(rays[BOTTOM_LEFT], enemies, occupied)
+      bottom_right_moves = self._get_valid_moves(rays[BOTTOM_RIGHT], enemies, occupied)
       moves = bottom_left_moves + bottom_right_moves
 
     captures = [m for m in moves if m[1] > 0]
 
     # return the best capture move (maximum capture) if we have to
     if captures and check_best_capture:
-      max_captures = self._get_max_capture_moves(square_location)
-      return max_captures
+      return self._max_capture_moves(square)
 
     return captures or moves
 
-  def _get_max_capture_moves(self, square_location):
-    """Return the capture moves that would lead to a maximum capture from given square location"""
-    moves = self._get_legal_moves(square_location, False)
+  def _max_capture_moves(self, square):
+    """Return the capture moves that would lead to a maximum capture from given square index"""
+    key = (self._hash, square)
+    result = self.capture_cache.get(key)
+    if result is not None:
+      return result
+
+    moves = self._square_moves(square, False)
     if not moves or moves[0][1] < 1:
       # moves are not captures
-      return [(None, 0)]
+      result = ((None, 0),)
+      self.capture_cache.put(key, result)
+      return result
 
     captures = []
     max_capture_count = -1
     for move, is_capture in moves:
       # do move
-      pieces, promotion = self._play_move(square_location, move, is_capture)
-      captured_count = len(pieces)
-      next_best = self._get_max_capture_moves(move)[0]
-      captured_count += next_best[1]
-      # undo move
-      self._undo_play_move(square_location, move, pieces, promotion)
+      pieces, promotion = self._move_piece(square, move, is_capture)
+      try:
+        captured_count = len(pieces) + self._max_capture_moves(move)[0][1]
+      finally:
+        # undo move, even if the search fails
+        self._unmove_piece(square, move, pieces, promotion)
       captures += [(move, captured_count)]
       max_capture_count = max(max_capture_count, captured_count)
 
-    return [move for move in captures if move[1] == max_capture_count]
+    result = tuple(move for move in captures if move[1] == max_capture_count)
+    self.capture_cache.put(key, result)
+    return result
 
-  def _play_move(self, start, destination, is_capture):
-    """Play a move on the board, move piece at start location to destination and return all pieces captured
-    and promoted piece"""
-    piece = self.board[start[0]][start[1]]
-    self.board[destination[0]][destination[1]] = piece
-    self.board[start[0]][start[1]] = None
+  def _move_piece(self, start, destination, is_capture):
+    """Move the piece at start square index to destination, return the captured pieces as
+    [(square, code), ...] and the code the piece had before a promotion (None if not promoted)"""
+    bitboards, cells = self._bitboards, self._cells
+    code = cells[start] - 1
+    bitboards[code] ^= (1 << start) | (1 << destination)
+    cells[start] = 0
+    cells[destination] = code + 1
+    key = self._hash ^ ZOBRIST_KEYS[code * SQUARES + start] ^ ZOBRIST_KEYS[code * SQUARES + destination]
 
     player = self.players[self.player_to_move_index]
     enemy = self.players[1 - self.player_to_move_index]
@@ -305,99 +1057,114 @@ class Checkers:
     # capture checkers
     captured = []
     if is_capture:
-      for coord in self._diagonal_coord(start, destination):
-        captured_checker = self.get_checker_details(coord)
-        if captured_checker != None:
-          captured += [(coord, captured_checker)]
-
-          if self._is_triple_king(captured_checker):
-            enemy.increment_triple_king_count(-1)
-          elif self._is_king(captured_checker):
-            enemy.increment_king_count(-1)
-
-          self.board[coord[0]][coord[1]] = None
+      pieces = BETWEEN[start * SQUARES + destination] & (self._color_mask(BLACK) | self._color_mask(WHITE))
+      while pieces:
+        bit = pieces & -pieces
+        pieces ^= bit
+        captured_code = cells[bit.bit_length() - 1] - 1
+        cells[bit.bit_length() - 1] = 0
+        captured += [(bit.bit_length() - 1, captured_code)]
+
+        if captured_code % 3 == TRIPLE_KING:
+          enemy.increment_triple_king_count(-1)
+        elif captured_code % 3 == KING:
+          enemy.increment_king_count(-1)
+
+        bitboards[captured_code] ^= bit
+        key ^= ZOBRIST_KEYS[captured_code * SQUARES + bit.bit_length() - 1]
+        self._piece_counts[captured_code // 3] -= 1
       player.increment_captured_pieces_count(len(captured))
 
     # Check for promotion
     promoted = None
-    # Promote to King if the piece reaches opponent's edge
-    if piece.lower() == 'white' and destination[0] == 7:
-      self.board[destination[0]][destination[1]] = 'White_king'
-      promoted = 'White'
-      player.increment_king_count()
-    elif piece.lower() == 'black' and destination[0] == 0:
-      self.board[destination[0]][destination[1]] = 'Black_king'
-      promoted = 'Black'
-      player.increment_king_count()
-
-    # Promote to Triple King if the piece returns to its original side
-    if not self._is_triple_king(piece) and self._is_king(piece):
-      if not self._is_black_piece(piece) and destination[0] == 0:
-        self.board[destination[0]][destination[1]] = 'White_Triple_King'
-        promoted = 'White_king'
-        player.increment_triple_king_count()
-      if self._is_black_piece(piece) and destination[0] == 7:
-        self.board[destination[0]][destination[1]] = 'Black_Triple_King'
-        promoted = 'Black_king'
+    color, rank = divmod(code, 3)
+    # Promote to King if the piece reaches opponent's edge,
+    # to Triple King if a king returns to its original side
+    if rank == MAN:
+      promotion_row = 7 if color == WHITE else 0
+    elif rank == KING:
+      promotion_row = 0 if color == WHITE else 7
+    else:
+      promotion_row = None
+
+    if SQUARE_ROWS[destination] == promotion_row:
+      bitboards[code] ^= 1 << destination
+      bitboards[code + 1] |= 1 << destination
+      cells[destination] = code + 2
+      key ^= ZOBRIST_KEYS[code * SQUARES + destination] ^ ZOBRIST_KEYS[(code + 1) * SQUARES + destination]
+      promoted = code
+      if rank == MAN:
+        player.increment_king_count()
+      else:
         player.increment_triple_king_count()
 
+    self._hash = key
     return captured, promoted
 
-  def _undo_play_move(self, start, destination, captured_checkers, promoted):
-    """Undo a played move on the board, return piece from destination to start location
-      and place all captured checkers at their original positions"""
-    self.board[start[0]][start[1]] = self.board[destination[0]][destination[1]]
-    self.board[destination[0]][destination[1]] = None
+  def _unmove_piece(self, start, destination, captured, promoted):
+    """Undo _move_piece, return piece from destination to start square index
+      and place all captured pieces at their original squares"""
+    bitboards, cells = self._bitboards, self._cells
+    code = cells[destination] - 1
+    bitboards[code] ^= 1 << destination
+    cells[destination] = 0
+    key = self._hash ^ ZOBRIST_KEYS[code * SQUARES + destination]
 
     player = self.players[self.player_to_move_index]
     enemy = self.players[1 - self.player_to_move_index]
 
     # restore checkers
-    for checkers in captured_checkers:
-      coord, piece = checkers
-      self.board[coord[0]][coord[1]] = piece
-      if self._is_triple_king(piece):
+    for square, captured_code in captured:
+      bitboards[captured_code] |= 1 << square
+      cells[square] = captured_code + 1
+      key ^= ZOBRIST_KEYS[captured_code * SQUARES + square]
+      self._piece_counts[captured_code // 3] += 1
+      if captured_code % 3 == TRIPLE_KING:
         enemy.increment_triple_king_count()
-      elif self._is_king(piece):
+      elif captured_code % 3 == KING:
         enemy.increment_king_count()
 
     # reduce captured pieces count
-    player.increment_captured_pieces_count(-len(captured_checkers))
+    player.increment_captured_pieces_count(-len(captured))
 
     # undo promotion
-    if promoted:
-      self.board[start[0]][start[1]] = promoted
+    if promoted is not None:
+      code = promoted
       # reduce king, triple king count
-      if 'ing' in promoted:  # a king was promoted to triple
+      if code % 3 == KING:  # a king was promoted to triple
         player.increment_triple_king_count(-1)
       else:
         player.increment_king_count(-1)
+    bitboards[code] |= 1 << start
+    cells[start] = code + 1
+    self._hash = key ^ ZOBRIST_KEYS[code * SQUARES + start]
 
-  def _get_valid_moves(self, diagonal_squares, piece, is_man=True, is_triple=False):
-    """Get list of all valid moves in a diagonal for opponent of given piece type
+  def _get_valid_moves(self, ray, enemies, occupied, is_man=True, is_triple=False):
+    """Get list of all valid moves along a diagonal ray of square indexes, enemies and occupied
+    are the bitboards of the opponent pieces and of all pieces on the board
     # Returns: [(move1, capture_count), ...]
     """
     all_moves, all_captures = [], []
     friendly = False
-    N = len(diagonal_squares)
+    N = len(ray)
 
     for i in range(N):
-      checker = self.get_checker_details(diagonal_squares[i])
+      bit = 1 << ray[i]
 
       if is_man:
-        if checker == None:
-          return [(diagonal_squares[i], 0)]
-        if piece in checker:
-          if i < N-1 and self.get_checker_details(diagonal_squares[i+1]) == None:
-            return [(diagonal_squares[i+1], 1)]
+        if not occupied & bit:
+          return [(ray[i], 0)]
+        if enemies & bit:
+          if i < N-1 and not occupied & (1 << ray[i+1]):
+            return [(ray[i+1], 1)]
         return []
 
-      if checker != None:
+      if occupied & bit:
         if i == N-1:
           break
 
-        next_checker = self.get_checker_details(diagonal_squares[i+1])
-        if piece not in checker:
+        next_bit = 1 << ray[i+1]
+        if not enemies & bit:
           # mark for Triple friendly
           if is_triple:
             friendly = True
@@ -405,66 +1172,94 @@ class Checkers:
           break
 
         jump = 1
-        if (next_checker != None and not is_triple):
+        if (occupied & next_bit and not is_triple):
           break
-        elif next_checker:
+        elif occupied & next_bit:
           # Triple king double enemy jump
-          if piece in next_checker and i < N-2 and self.get_checker_details(diagonal_squares[i+2]) == None:
+          if enemies & next_bit and i < N-2 and not occupied & (1 << ray[i+2]):
             jump = 2
 
         for j in range(i + jump, N):
-          c = self.get_checker_details(diagonal_squares[j])
-          if c != None:
+          if occupied & (1 << ray[j]):
             break
-          all_captures += [(diagonal_squares[j], jump)]
+          all_captures += [(ray[j], jump)]
         break
       elif not all_moves or friendly:
-        all_moves += [(diagonal_squares[i], 0)]
+        all_moves += [(ray[i], 0)]
     return all_captures or all_moves
 
-  def _diagonal_squares(self, square, dx, dy):
-    """Return diagonal moves from a given square"""
-    squares = []
-    square = list(square)
-    while True:
-      square[0] += dx
-      square[1] += dy
-      if not self._in_bound(square):
-        break
-      squares += [tuple(square)]
-    return squares
-
-  def _diagonal_coord(self, start, stop):
-    """Return coordinates in between two points along a diagonal path"""
-    def coords(dxdy):
-      r, c = start
-      dx, dy = dxdy
-      coords = []
-      while (r, c) != stop:
-        r += dx
-        c += dy
-        if not self._in_bound((r, c)) or (r, c) == stop:
-          break
-        coords += [(r, c)]
-      return coords
-    r1, c1 = start
-    r2, c2 = stop
-    P = (+(r1 != r2) if r2 >= r1 else -1, -(c1 != c2) if c2 <= c1 else +1)
-    return coords(P)
+  def _piece_at(self, square):
+    """Return the code of the piece on given square index, None if the square is empty"""
+    cell = self._cells[square]
+    return cell - 1 if cell else None
+
+  def _can_capture(self, square):
+    """Return True if the piece on given square index can capture, that is if its player keeps the turn"""
+    moves = self._square_moves(square)
+    return bool(moves) and moves[0][1] > 0
+
+  def _set_bitboards(self, bitboards):
+    """Replace the position with given list of bitboards (one per piece code)"""
+    self._bitboards = bitboards
+    # flat board of the squares next to the bitboards, 0 for an empty square and 1 + the piece code for a piece
+    self._cells = bytearray(SQUARES)
+    for code, mask in enumerate(bitboards):
+      while mask:
+        bit = mask & -mask
+        mask ^= bit
+        self._cells[bit.bit_length() - 1] = code + 1
+    self._hash = self._compute_hash()
+    self._piece_counts = [self._color_mask(BLACK).bit_count(), self._color_mask(WHITE).bit_count()]
+    # per-square move cache, _cached_squares has the squares with a valid entry and _wide_squares
+    # those whose entry is a capture, which is dropped on any change of the board
+    self._move_cache = [None] * SQUARES
+    self._cached_squares = 0
+    self._wide_squares = 0
+
+  def _compute_hash(self):
+    """Return the Zobrist key of the pieces on the board, computed from scratch"""
+    key = 0
+    for code, mask in enumerate(self._bitboards):
+      while mask:
+        bit = mask & -mask
+        mask ^= bit
+        key ^= ZOBRIST_KEYS[code * SQUARES + bit.bit_length() - 1]
+    return key
+
+  def _color_mask(self, color):
+    """Return the bitboard of all pieces of given color"""
+    bitboards = self._bitboards
+    index = color * 3
+    return bitboards[index] | bitboards[index + 1] | bitboards[index + 2]
 
   def _in_bound(self, square):
-    """Check if given square position is in bound"""
+    """Check if given square position is a (row, col) pair of ints in bound"""
+    if not isinstance(square, (tuple, list)) or len(square) != 2:
+      return False
     row, col = square
+    if not isinstance(row, int) or not isinstance(col, int):
+      return False
     return (row >= 0 and row <= 7 and col >= 0 and col <= 7)
 
   def _is_king(self, piece):
-    """Check if a piece is king"""
-    return 'ing' in piece.lower()
+    """Check if a piece (a Piece or a piece name) is king"""
+    return PIECES[_piece_code(piece)].rank != MAN
 
   def _is_triple_king(self, piece):
-    """Check if a piece is Triple king"""
-    return 'triple' in piece.lower()
+    """Check if a piece (a Piece or a piece name) is Triple king"""
+    return PIECES[_piece_code(piece)].rank == TRIPLE_KING
 
   def _is_black_piece(self, piece):
-    """Check if a piece is Black"""
-    return 'black' in piece.lower()
+    """Check if a piece (a Piece or a piece name) is Black"""
+    return PIECES[_piece_code(piece)].color == BLACK
+
+
+def new_game(layout=None, player_to_move=BLACK):
+  """Return a game with two players, set up from given layout (the start position if None)"""
+  game = Checkers()
+  game.create_player("White", "White")
+  game.create_player("Black", "Black")
+  if layout is not None:
+    game.board = parse_layout(layout)
+  game.player_to_move_index = player_to_move
+  return game
@@ -1,3 +1,8 @@
+import copy
+import pickle
+import random
+import sys
+import threading
 import unittest
 from CheckersGame import *
 
@@ -31,6 +36,41 @@ class TestCheckersGame(unittest.TestCase):
     with self.assertRaises(OutofTurn):
       self.game.play_game("Adam", (2, 1), (3, 0))
 
+  def test_pieces(self):
+    # Test the piece codes and their names on the board
+    self.assertEqual(Piece.WHITE_TRIPLE_KING.color, WHITE)
+    self.assertEqual(Piece.WHITE_TRIPLE_KING.rank, TRIPLE_KING)
+    self.assertEqual(str(Piece.BLACK_KING), 'Black_king')
+    self.assertEqual([p.label for p in Piece], list(PIECE_NAMES))
+
+    # captured pieces come back as Piece values
+    self.game.board = B([
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', 'Wk', '-', '-', '-', '-', '-'],
+        ['-', 'B', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+    ])
+    captured, promoted = self.game._play_move((6, 1), (4, 3), True)
+    self.assertEqual(captured, [((5, 2), Piece.WHITE_KING)])
+    self.assertIsNone(promoted)
+
+    # Piece values can be put on the board, Piece.BLACK (code 0) included
+    board = [[None] * 8 for _ in range(8)]
+    board[5][2], board[2][1] = Piece.BLACK, Piece.WHITE_KING
+    self.game.board = board
+    self.assertEqual(self.game.get_checker_details((5, 2)), 'Black')
+    self.assertEqual(self.game.get_checker_details((2, 1)), 'White_king')
+    self.game.board[5][4] = Piece.BLACK
+    self.assertEqual(self.game.get_checker_details((5, 4)), 'Black')
+
+    # players have no instance dict
+    with self.assertRaises(AttributeError):
+      self.player1.rating = 1
+
   def test_get_checker_details(self):
     # Test for valid square_location
     self.assertEqual(self.game.get_checker_details((3, 1)), None)
@@ -40,6 +80,71 @@ class TestCheckersGame(unittest.TestCase):
     with self.assertRaises(InvalidSquare):
       self.game.get_checker_details((9, 9))
 
+  def test_board_assignment(self):
+    # Test that an assigned board is read back unchanged
+    test_board = B([
+        ['-', 'W', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', 'B*', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', 'W*', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', 'Wk', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', 'Bk', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['B', '-', '-', '-', '-', '-', '-', '-'],
+    ])
+    self.game.board = test_board
+    self.assertEqual(self.game.board, test_board)
+    self.assertEqual(self.game.get_checker_details((1, 2)), 'Black_Triple_King')
+    self.assertEqual(self.game.get_checker_details((3, 4)), 'White_king')
+    self.assertIsNone(self.game.get_checker_details((4, 4)))
+
+    # setting a square or a row of the returned board changes the game
+    self.game.board[7][0] = None
+    self.assertIsNone(self.game.get_checker_details((7, 0)))
+    self.game.board[4][3] = "White"
+    self.assertEqual(self.game.get_checker_details((4, 3)), 'White')
+    other = Checkers()
+    other.board = self.game.board
+    self.assertEqual(other.position_hash(), self.game.position_hash())
+    board = self.game.board
+    board[3] = [None] * 8
+    self.assertIsNone(self.game.get_checker_details((3, 4)))
+    self.assertEqual(board[3], [None] * 8)
+    self.assertEqual(self.game.board, board)
+
+    # a square set on an old board only changes that square
+    self.game.board = Checkers().board
+    board = self.game.board
+    self.game.play_game("Lucy", (5, 6), (4, 7))
+    board[5][0] = None
+    self.assertIsNone(self.game.get_checker_details((5, 6)))
+    self.assertEqual(self.game.get_checker_details((4, 7)), "Black")
+    self.assertIsNone(self.game.get_checker_details((5, 0)))
+    # copies are plain lists, detached from the game
+    copied = copy.deepcopy(self.game.board)
+    self.assertIs(type(copied[0]), list)
+    copied[4][7] = None
+    self.assertEqual(self.game.get_checker_details((4, 7)), "Black")
+    pickled = pickle.loads(pickle.dumps(self.game.board))
+    self.assertEqual(pickled, self.game.board)
+    self.assertIs(type(pickled[0]), list)
+
+  def test_ray_tables(self):
+    # Test the precomputed diagonals of square (2, 3)
+    square = SQUARE_INDEX[(2, 3)]
+    self.assertEqual(square, 2 * 4 + 3 // 2)
+    self.assertEqual([SQUARE_COORDS[s] for s in RAYS[square][TOP_LEFT]], [(1, 2), (0, 1)])
+    self.assertEqual([SQUARE_COORDS[s] for s in RAYS[square][BOTTOM_RIGHT]],
+                     [(3, 4), (4, 5), (5, 6), (6, 7)])
+    self.assertEqual(BETWEEN[square * SQUARES + SQUARE_INDEX[(5, 6)]],
+                     (1 << SQUARE_INDEX[(3, 4)]) | (1 << SQUARE_INDEX[(4, 5)]))
+    self.assertEqual(BETWEEN[square * SQUARES + SQUARE_INDEX[(5, 5)]], 0)
+
+    # the dark squares come first, the start position fits in 32 bits
+    self.assertTrue(all((row + col) % 2 for row, col in SQUARE_COORDS[:DARK_SQUARES]))
+    self.assertLess(max(self.game._bitboards), 1 << DARK_SQUARES)
+    self.assertTrue(all(s >= DARK_SQUARES for ray in RAYS[SQUARE_INDEX[(6, 2)]] for s in ray))
+
   def test_max_capture_rule(self):
     # Test max capture rule
     test_board = B([
@@ -74,6 +179,318 @@ class TestCheckersGame(unittest.TestCase):
         ['-', '-', '-', '-', '-', '-', '-', '-'],
     ]))
 
+  def test_capture_path(self):
+    # Test that a whole multiple capture can be played in one call
+    test_board = B([
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', 'W', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', 'W', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', 'W', '-', 'W', '-', '-'],
+        ['-', '-', '-', '-', 'B', '-', '-', '-'],
+    ])
+    self.game.board = test_board
+    path = [(5, 6), (3, 4), (1, 6)]
+    self.assertEqual(self.game.get_capture_paths((7, 4)), [path])
+    self.assertEqual(self.game.get_capture_paths((6, 3)), [])
+    self.assertEqual(self.game.get_capture_paths((0, 0)), [])
+    self.assertEqual(self.player2.get_captured_pieces_count(), 0)
+
+    # incomplete or wrong paths are rejected and leave the game unchanged
+    for bad_path in ([], [(5, 6)], [(5, 6), (3, 4)], [(5, 2), (3, 0)], [(5, 6), (3, 4), (1, 6), (0, 7)],
+                     [5, 6], [(5, 6), 9], [(5, 6), (3, 4, 1)], ["a3"], [(5, 6), (3, None)], [(5, 6), (3, 4), (1.0, 6)]):
+      with self.assertRaises(InvalidSquare):
+        self.game.play_game("Lucy", (7, 4), bad_path)
+    for bad_square in ("a3", (5, None), (7,), None):
+      with self.assertRaises(InvalidSquare):
+        self.game.play_game("Lucy", bad_square, path)
+      with self.assertRaises(InvalidSquare):
+        self.game.play_game("Lucy", (7, 4), bad_square)
+      with self.assertRaises(InvalidSquare):
+        self.game.get_checker_details(bad_square)
+    self.assertEqual(self.game.board, test_board)
+    self.assertEqual(self.game.player_to_move_index, BLACK)
+
+    self.assertEqual(self.game.play_game("Lucy", (7, 4), path), 3)
+    self.assertEqual(self.player2.get_captured_pieces_count(), 3)
+    self.assertEqual(self.game.player_to_move_index, WHITE)
+    self.assertEqual(self.game.get_checker_details((1, 6)), "Black")
+
+    # a one square path is a simple move
+    self.assertEqual(self.game.play_game("Adam", (6, 3), [(7, 2)]), 0)
+    self.assertEqual(self.game.get_checker_details((7, 2)), "White_king")
+
+  def test_profiling(self):
+    # Test the phase counters and that disabling removes the wrappers
+    self.assertIsNone(self.game.profile_stats())
+    self.game.capture_cache = CaptureCache()
+    reports = []
+    self.game.enable_profiling(reports.append)
+    self.game.board = B([
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', 'W', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', 'W', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', 'W', '-', 'W', '-', '-'],
+        ['-', '-', '-', '-', 'B', '-', '-', '-'],
+    ])
+    self.game.play_game('Lucy', (7, 4), (5, 6))
+    self.game.game_winner()
+
+    stats = self.game.profile_stats()
+    self.assertEqual(len(reports), 1)
+    self.assertEqual(reports[0]["play_game"]["calls"], 1)
+    self.assertEqual(stats["winner_check"]["calls"], 1)
+    self.assertGreater(stats["capture_search"]["calls"], 3)
+    self.assertEqual(stats["max_capture_depth"], 4)
+    self.assertGreater(stats["move_application"]["calls"], 0)
+    self.assertGreaterEqual(stats["play_game"]["seconds"], 0)
+
+    self.game.disable_profiling()
+    self.assertNotIn("play_game", vars(self.game))
+    self.game.game_winner()
+    self.assertEqual(self.game.profile_stats()["winner_check"]["calls"], 1)
+
+  def test_capture_cache(self):
+    # Test that repeated max-capture searches are answered from the cache
+    self.game.capture_cache = CaptureCache(maxsize=4)
+    self.game.board = B([
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', 'W', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', 'W', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', 'W', '-', 'W', '-', '-'],
+        ['-', '-', '-', '-', 'B', '-', '-', '-'],
+    ])
+    moves = self.game._get_max_capture_moves((7, 4))
+    misses = self.game.capture_cache.misses
+    self.assertEqual(self.game._get_max_capture_moves((7, 4)), moves)
+    self.assertEqual(moves, [((5, 6), 3)])
+
+    stats = self.game.capture_cache.stats()
+    self.assertEqual(stats["misses"], misses)
+    self.assertGreater(stats["hits"], 0)
+    self.assertLessEqual(stats["size"], 4)
+
+  def test_capture_cache_threads(self):
+    # Test that threads can share a small cache while it evicts entries
+    cache = CaptureCache(maxsize=2)
+    errors = []
+
+    def hammer(seed):
+      rng = random.Random(seed)
+      try:
+        for _ in range(100000):
+          key = rng.randrange(4)
+          if cache.get(key) is None:
+            cache.put(key, (key,))
+      except Exception as error:
+        errors.append(error)
+
+    # switch threads as often as possible to interleave the cache updates
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+      threads = [threading.Thread(target=hammer, args=(seed,)) for seed in range(8)]
+      for thread in threads:
+        thread.start()
+      for thread in threads:
+        thread.join()
+    finally:
+      sys.setswitchinterval(interval)
+    self.assertEqual(errors, [])
+    self.assertEqual(len(cache), 2)
+
+  def test_position_hash(self):
+    # Test that the Zobrist key follows moves, undos and board assignment
+    start_hash = self.game.position_hash()
+    self.game.play_game("Lucy", (5, 6), (4, 7))
+    self.assertNotEqual(self.game.position_hash(), start_hash)
+
+    other = Checkers()
+    other.board = self.game.board
+    other.player_to_move_index = self.game.player_to_move_index
+    self.assertEqual(other.position_hash(), self.game.position_hash())
+
+    test_board = B([
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', 'B*', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', 'W', '-', '-', '-', 'W*'],
+        ['-', '-', '-', '-', 'W', '-', 'B', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+    ])
+    self.game.board = test_board
+    before = self.game.position_hash()
+    captured, promoted = self.game._play_move((1, 2), (4, 5), True)
+    self.assertEqual(len(captured), 2)
+    self.assertEqual(self.game.position_hash(), self.game._compute_hash() ^ ZOBRIST_WHITE_TO_MOVE)
+    self.game._undo_play_move((1, 2), (4, 5), captured, promoted)
+    self.assertEqual(self.game.position_hash(), before)
+
+  def test_make_unmake_move(self):
+    # Test that make_move keeps the turn during a capture and unmake_move restores everything
+    test_board = B([
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', 'W', '-', 'W', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', 'W', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', 'B', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+    ])
+    self.game.board = test_board
+    self.assertEqual(self.game.legal_moves(), [((5, 4), (3, 2), 2)])
+    before = (self.game.board, self.game.position_hash(), self.player2.get_captured_pieces_count())
+
+    first = self.game.make_move((5, 4), (3, 2))
+    self.assertEqual(self.game.player_to_move_index, BLACK)
+    self.assertEqual(self.player2.get_captured_pieces_count(), 1)
+    second = self.game.make_move((3, 2), (1, 4))
+    self.assertEqual(self.game.player_to_move_index, WHITE)
+    self.assertEqual(self.game.get_checker_details((1, 4)), "Black")
+    self.assertEqual(self.game.position_hash(), self.game._compute_hash() ^ ZOBRIST_WHITE_TO_MOVE)
+
+    self.game.unmake_move(second)
+    self.game.unmake_move(first)
+    self.assertEqual(self.game.player_to_move_index, BLACK)
+    self.assertEqual((self.game.board, self.game.position_hash(), self.player2.get_captured_pieces_count()), before)
+    self.assertEqual(self.game.legal_moves(), [((5, 4), (3, 2), 2)])
+
+  def test_snapshot_restore(self):
+    snapshot = self.game.snapshot()
+    board, key = self.game.board, self.game.position_hash()
+    self.game.play_game("Lucy", (5, 2), (4, 3))
+    self.game.play_game("Adam", (2, 5), (3, 4))
+    self.game.play_game("Lucy", (4, 3), (2, 5))
+    self.assertEqual(self.player2.get_captured_pieces_count(), 1)
+
+    self.game.restore(snapshot)
+    self.assertEqual(self.game.board, board)
+    self.assertEqual(self.game.position_hash(), key)
+    self.assertEqual(self.player2.get_captured_pieces_count(), 0)
+    self.assertEqual(self.game.get_checker_details((5, 2)), "Black")
+    self.assertEqual(self.game.legal_moves(), Checkers().legal_moves())
+    # the snapshot is not changed by playing on
+    self.game.play_game("Lucy", (5, 2), (4, 3))
+    self.game.restore(snapshot)
+    self.assertEqual(self.game.board, board)
+
+  def test_position_string(self):
+    start = "1w1w1w1w/w1w1w1w1/1w1w1w1w/8/8/b1b1b1b1/1b1b1b1b/b1b1b1b1 b 0,0,0 0,0,0"
+    self.assertEqual(self.game.to_string(), start)
+    self.game.board = B([
+        ['-', '-', '-', '-', '-', '-', '-', 'B'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', 'W*', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', 'Bk', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', 'Wk', '-', 'B*', '-', '-'],
+        ['W', '-', '-', '-', '-', '-', '-', '-'],
+    ])
+    self.game.player_to_move_index = WHITE
+    self.player2.increment_captured_pieces_count(9)
+    self.player2.increment_king_count(2)
+    self.player1.increment_triple_king_count()
+    text = self.game.to_string()
+    self.assertEqual(text, "7b/8/3W*4/8/1B6/8/3W1B*2/w7 w 2,0,9 0,1,0")
+
+    game = Checkers()
+    black, white = game.create_player("Lucy", "Black"), game.create_player("Adam", "White")
+    game.from_string(text)
+    self.assertEqual(game.board, self.game.board)
+    self.assertEqual(game.position_hash(), self.game.position_hash())
+    self.assertEqual(game.legal_moves(), self.game.legal_moves())
+    self.assertEqual((black.get_king_count(), black.get_captured_pieces_count()), (2, 9))
+    self.assertEqual(white.get_triple_king_count(), 1)
+    game.from_string(start)
+    self.assertEqual(game.board, Checkers().board)
+
+    for bad in ("", "8/8/8/8/8/8/8 b 0,0,0 0,0,0", "9/8/8/8/8/8/8/8 b 0,0,0 0,0,0", "7x/8/8/8/8/8/8/8 b 0,0,0 0,0,0",
+                "8/8/8/8/8/8/8/8 r 0,0,0 0,0,0", "8/8/8/8/8/8/8/8 b 0,0 0,0,0", "bbbbbbbbb/8/8/8/8/8/8/8 b 0,0,0 0,0,0"):
+      with self.assertRaises(ValueError):
+        game.from_string(bad)
+
+  def test_position_bytes(self):
+    self.game.play_game("Lucy", (5, 2), (4, 3))
+    self.game.play_game("Adam", (2, 5), (3, 4))
+    self.game.play_game("Lucy", (4, 3), (2, 5))
+    data = self.game.to_bytes()
+    self.assertEqual(len(data), 31)
+
+    game = Checkers()
+    black = game.create_player("Lucy", "Black")
+    game.create_player("Adam", "White")
+    game.from_bytes(data)
+    self.assertEqual(game.to_string(), self.game.to_string())
+    self.assertEqual(game.position_hash(), self.game.position_hash())
+    self.assertEqual(black.get_captured_pieces_count(), 1)
+
+    # bytes that are not a packed position leave the game unchanged: a wrong length, a wrong player to move,
+    # a black and a white man on square 0, a negative counter
+    values = list(PACKED_POSITION.unpack(data))
+    overlap = PACKED_POSITION.pack(values[0] | 1, values[1], values[2], values[3] | 1, *values[4:])
+    negative = PACKED_POSITION.pack(*values[:7], -1, *values[8:])
+    for bad in (data[:-1], data + b"\0", data[:24] + b"\7" + data[25:], overlap, negative):
+      with self.assertRaises(ValueError):
+        game.from_bytes(bad)
+    self.assertEqual(game.to_bytes(), data)
+
+    # light squares are not packed
+    self.game.board = B([['B', '-', '-', '-', '-', '-', '-', '-']] + [['-'] * 8] * 7)
+    with self.assertRaises(ValueError):
+      self.game.to_bytes()
+
+  def test_canonical_position(self):
+    # black to move is canonical, white to move is turned half a turn with the colors swapped
+    self.assertEqual(self.game.canonical_position(), (self.game._bitboards, IDENTITY))
+    self.assertEqual(self.game.canonical_hash(), (self.game.position_hash(), IDENTITY))
+    self.game.play_game("Lucy", (5, 0), (4, 1))
+    bitboards, transform = self.game.canonical_position()
+    self.assertEqual(transform, ROTATED)
+    self.assertEqual(rotate_bitboards(bitboards), self.game._bitboards)
+
+    rotated = Checkers()
+    rotated.create_player("Adam", "White")
+    rotated.create_player("Lucy", "Black")
+    rotated._set_bitboards(bitboards)
+    self.assertEqual(rotated.get_checker_details((3, 6)), "White")
+    self.assertEqual(rotated.get_checker_details((2, 7)), None)
+    self.assertEqual(self.game.canonical_hash(), (rotated.position_hash(), ROTATED))
+    moves = [(transform_square(start, transform), transform_square(destination, transform), count)
+             for start, destination, count in rotated.legal_moves()]
+    self.assertEqual(sorted(moves), sorted(self.game.legal_moves()))
+
+  def test_move_cache(self):
+    # Test that cached moves are dropped only when a move changes their diagonals
+    self.game._get_player_moves(BLACK)
+    self.game._get_player_moves(WHITE)
+    cached = self.game._cached_squares
+    self.game.play_game("Lucy", (5, 6), (4, 7))
+    self.assertNotEqual(self.game._cached_squares, 0)
+    self.assertNotEqual(self.game._cached_squares, cached)
+    # the white piece on (2, 1) does not see (5, 6) or (4, 7)
+    self.assertTrue(self.game._cached_squares & (1 << SQUARE_INDEX[(2, 1)]))
+    self.assertFalse(self.game._cached_squares & (1 << SQUARE_INDEX[(5, 6)]))
+
+    # cached and freshly generated moves agree
+    moves = self.game._get_player_moves(WHITE)
+    fresh = Checkers()
+    fresh.create_player("Adam", "White")
+    fresh.create_player("Lucy", "Black")
+    fresh.board = self.game.board
+    self.assertEqual(moves, fresh._get_player_moves(WHITE))
+
   def test_king_promotion(self):
     # Test King promotion
     test_board = B([
@@ -351,6 +768,39 @@ class TestCheckersGame(unittest.TestCase):
     self.assertEqual(self.game.game_winner(), 'Adam')  # white wins
 
 
+  def test_game_winner_blocked_pieces(self):
+    # Test winner detection when the only moves left are captures
+    self.game.board = B([
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', 'W', '-', 'W', '-', '-', '-', '-'],
+        ['-', '-', 'B', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+    ])
+    # black is blocked but can capture
+    self.assertTrue(self.game._has_legal_move(BLACK))
+    self.assertEqual(self.game.game_winner(), "Game has not ended")
+
+    # capturing the last piece of a player ends the game at once
+    self.game.board = B([
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+        ['-', 'W', '-', '-', '-', '-', '-', '-'],
+        ['-', '-', 'B', '-', '-', '-', '-', '-'],
+        ['-', '-', '-', '-', '-', '-', '-', '-'],
+    ])
+    self.assertEqual(self.game._piece_counts, [1, 1])
+    self.game.play_game('Lucy', (6, 2), (4, 0))
+    self.assertEqual(self.game._piece_counts, [1, 0])
+    self.assertFalse(self.game._has_legal_move(WHITE))
+    self.assertEqual(self.game.game_winner(), 'Lucy')
+
 def B(board):
   """We'll use this to convert a simpler representation of the checkers board"""
   b = [[None for _ in range(8)] for _ in range(8)]
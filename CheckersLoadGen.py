@@ -0,0 +1,85 @@
+# Author: Biereagu Sochima
+# GitHub username: kodejuice
+# Date: 18/10/2026
+# Description: Load generator measuring the move latency of the Checkers server
+
+# CheckersLoadGen.py
+
+import asyncio
+import random
+import sys
+import time
+
+
+async def _request(reader, writer, line):
+  """Send one request and return the reply words, raise RuntimeError on an error reply"""
+  writer.write(line.encode() + b"\n")
+  await writer.drain()
+  reply = (await reader.readline()).decode().split()
+  if not reply or reply[0] != "OK":
+    raise RuntimeError("%s: %s" % (line, " ".join(reply)))
+  return reply[1:]
+
+
+async def play_games(host, port, games, seed, latencies, max_plies=300):
+  """Play games one after another on one connection, picking random legal moves.
+  The time of every MOVE request is appended to latencies"""
+  rng = random.Random(seed)
+  reader, writer = await asyncio.open_connection(host, port)
+  try:
+    for _ in range(games):
+      session = (await _request(reader, writer, "NEW White Black"))[0]
+      for _ in range(max_plies):
+        reply = await _request(reader, writer, "MOVES " + session)
+        player, moves = reply[0], reply[1:]
+        if not moves:
+          break
+        start, destination = rng.choice(moves).split("-")
+        begin = time.perf_counter()
+        await _request(reader, writer, "MOVE %s %s %s %s" % (session, player, start, destination))
+        latencies.append(time.perf_counter() - begin)
+        if (await _request(reader, writer, "WINNER " + session)) != ["Game", "has", "not", "ended"]:
+          break
+      await _request(reader, writer, "CLOSE " + session)
+    writer.write(b"QUIT\n")
+    await writer.drain()
+  finally:
+    writer.close()
+
+
+def percentile(values, p):
+  """Return the p-th percentile (0-100) of a list of values"""
+  values = sorted(values)
+  if not values:
+    return 0.0
+  return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+async def run(host="127.0.0.1", port=8162, connections=100, games_per_connection=1, seed=0):
+  """Play games on many concurrent connections, return the move latency statistics as a dict"""
+  latencies = []
+  begin = time.perf_counter()
+  await asyncio.gather(*(play_games(host, port, games_per_connection, seed + i, latencies)
+                         for i in range(connections)))
+  seconds = time.perf_counter() - begin
+  return {
+      "games": connections * games_per_connection,
+      "moves": len(latencies),
+      "seconds": seconds,
+      "moves_per_sec": len(latencies) / seconds if seconds else 0.0,
+      "p50": percentile(latencies, 50),
+      "p99": percentile(latencies, 99),
+  }
+
+
+def main(argv):
+  port = int(argv[1]) if len(argv) > 1 else 8162
+  connections = int(argv[2]) if len(argv) > 2 else 100
+  games = int(argv[3]) if len(argv) > 3 else 1
+  stats = asyncio.run(run(port=port, connections=connections, games_per_connection=games))
+  print("%(games)d games, %(moves)d moves in %(seconds).1fs, %(moves_per_sec).0f moves/sec" % stats)
+  print("move latency p50 %.2fms p99 %.2fms" % (stats["p50"] * 1000, stats["p99"] * 1000))
+
+
+if __name__ == '__main__':
+  main(sys.argv)
@@ -0,0 +1,138 @@
+# Author: Biereagu Sochima
+# GitHub username: kodejuice
+# Date: 18/10/2026
+# Description: Monte Carlo tree search player for the Checkers game
+
+# CheckersMCTS.py
+
+import math
+import multiprocessing
+import random
+
+from CheckersGame import new_game
+
+
+class _Node:
+  """Node of the search tree, reached by playing move. side is the player who played it,
+  wins counts the playouts side won (a draw counts half)"""
+
+  __slots__ = ("move", "side", "parent", "children", "untried", "visits", "wins")
+
+  def __init__(self, move, side, parent, untried):
+    self.move = move
+    self.side = side
+    self.parent = parent
+    self.children = []
+    self.untried = untried
+    self.visits = 0
+    self.wins = 0.0
+
+  def select(self, exploration):
+    """Return the child with the highest UCT score"""
+    log_visits = math.log(self.visits)
+    return max(self.children,
+               key=lambda c: c.wins / c.visits + exploration * math.sqrt(log_visits / c.visits))
+
+
+class MCTSPlayer:
+  """UCT Monte Carlo tree search. Every playout descends the tree, adds one node and plays random
+  moves to the end of the game (a draw after max_playout_plies plies), all with make_move and unmake_move.
+  With processes > 1 the playouts are split over a pool of processes, each growing its own tree
+  from the root (root parallelization), and the statistics of the root moves are merged"""
+
+  def __init__(self, playouts=1000, exploration=1.4, max_playout_plies=200, processes=1, seed=None):
+    self.playouts = playouts
+    self.exploration = exploration
+    self.max_playout_plies = max_playout_plies
+    self.processes = processes
+    self.rng = random.Random(seed)
+    self.root_stats = {}
+
+  def search(self, game, playouts=None):
+    """Return the most visited (start, destination) move of the player to move after the playouts.
+    Returns None if the player has no move. The game is left unchanged,
+    root_stats maps every root move to its (visits, wins)"""
+    self.root_stats = {}
+    moves = game.legal_moves()
+    if not moves:
+      return None
+    if len(moves) == 1:
+      return moves[0][0], moves[0][1]
+
+    playouts = playouts or self.playouts
+    processes = min(self.processes or multiprocessing.cpu_count(), playouts)
+    if processes > 1:
+      snapshot = game.snapshot()
+      tasks = [(snapshot, playouts // processes + (i < playouts % processes), self.exploration,
+                self.max_playout_plies, self.rng.getrandbits(64)) for i in range(processes)]
+      with multiprocessing.Pool(processes) as pool:
+        for stats in pool.map(_search_task, tasks):
+          for move, (visits, wins) in stats.items():
+            total = self.root_stats.get(move, (0, 0.0))
+            self.root_stats[move] = (total[0] + visits, total[1] + wins)
+    else:
+      self.root_stats = self._grow(game, playouts, self.rng)
+
+    start, destination = max(self.root_stats, key=lambda m: self.root_stats[m])
+    return start, destination
+
+  def play(self, game, playouts=None):
+    """Search and play the best move for the player to move with play_game.
+    Returns the number of captured pieces, None if the player has no move"""
+    move = self.search(game, playouts)
+    if move is None:
+      return None
+    player = game.players[game.player_to_move_index]
+    return game.play_game(player.player_name, move[0], move[1])
+
+  def _grow(self, game, playouts, rng):
+    """Run playouts on a new tree rooted at the position of the game.
+    Returns {(start, destination): (visits, wins)} of the root moves"""
+    root = _Node(None, None, None, game.legal_moves())
+    exploration = self.exploration
+    for _ in range(playouts):
+      node, tokens = root, []
+      while not node.untried and node.children:
+        node = node.select(exploration)
+        tokens += [game.make_move(node.move[0], node.move[1])]
+      if node.untried:
+        move = node.untried.pop(rng.randrange(len(node.untried)))
+        side = game.player_to_move_index
+        tokens += [game.make_move(move[0], move[1])]
+        child = _Node(move, side, node, game.legal_moves())
+        node.children += [child]
+        node = child
+
+      winner = self._playout(game, rng)
+      for token in reversed(tokens):
+        game.unmake_move(token)
+      while node is not None:
+        node.visits += 1
+        node.wins += 0.5 if winner is None else winner == node.side
+        node = node.parent
+    return {(c.move[0], c.move[1]): (c.visits, c.wins) for c in root.children}
+
+  def _playout(self, game, rng):
+    """Play random moves to the end of the game and take them back.
+    Returns the color of the winner, None if the game did not end within max_playout_plies plies"""
+    tokens, winner = [], None
+    for _ in range(self.max_playout_plies):
+      moves = game.legal_moves()
+      if not moves:
+        # the player to move has lost
+        winner = 1 - game.player_to_move_index
+        break
+      move = moves[rng.randrange(len(moves))]
+      tokens += [game.make_move(move[0], move[1])]
+    for token in reversed(tokens):
+      game.unmake_move(token)
+    return winner
+
+
+def _search_task(task):
+  """Grow a tree in a worker process, task is (snapshot, playouts, exploration, max_playout_plies, seed)"""
+  snapshot, playouts, exploration, max_playout_plies, seed = task
+  game = new_game()
+  game.restore(snapshot)
+  player = MCTSPlayer(playouts, exploration, max_playout_plies)
+  return player._grow(game, playouts, random.Random(seed))
@@ -0,0 +1,54 @@
+import unittest
+from CheckersMCTS import *
+from CheckersGame import new_game
+
+# Black to move wins by closing the last white man in: Bk (6, 3) -> (7, 2)
+CLOSE_IN = [
+    "-  -  -  -  -  -  -  -",
+    "-  -  -  -  -  -  -  -",
+    "-  -  -  -  -  -  -  -",
+    "-  -  -  -  -  -  -  -",
+    "-  -  -  -  -  -  -  -",
+    "-  -  B  -  -  -  -  -",
+    "-  W  -  Bk -  -  -  -",
+    "B  -  -  -  -  -  -  -",
+]
+
+
+class TestCheckersMCTS(unittest.TestCase):
+  def test_finds_win(self):
+    game = new_game(CLOSE_IN)
+    saved = game.snapshot()
+    player = MCTSPlayer(playouts=300, seed=1)
+    self.assertEqual(player.search(game), ((6, 3), (7, 2)))
+    self.assertEqual(game.snapshot(), saved)
+    self.assertEqual(sum(visits for visits, _ in player.root_stats.values()), 300)
+    visits, wins = player.root_stats[((6, 3), (7, 2))]
+    self.assertEqual(visits, wins)
+
+  def test_legal_and_reproducible(self):
+    game = new_game()
+    moves = {(m[0], m[1]) for m in game.legal_moves()}
+    move = MCTSPlayer(playouts=60, seed=5).search(game)
+    self.assertIn(move, moves)
+    self.assertEqual(MCTSPlayer(playouts=60, seed=5).search(game), move)
+    self.assertIsNone(MCTSPlayer().search(new_game(["- " * 8] * 8)))
+
+  def test_play(self):
+    game = new_game()
+    player = MCTSPlayer(playouts=20, max_playout_plies=40, seed=2)
+    self.assertEqual(player.play(game), 0)
+    self.assertEqual(game.player_to_move_index, 1)
+
+  def test_root_parallel(self):
+    game = new_game(CLOSE_IN)
+    player = MCTSPlayer(playouts=301, processes=2, seed=3)
+    self.assertEqual(player.search(game), ((6, 3), (7, 2)))
+    self.assertEqual(sum(visits for visits, _ in player.root_stats.values()), 301)
+    again = MCTSPlayer(playouts=301, processes=2, seed=3)
+    again.search(game)
+    self.assertEqual(again.root_stats, player.root_stats)
+
+
+if __name__ == '__main__':
+  unittest.main()
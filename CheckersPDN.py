@@ -0,0 +1,167 @@
+# Author: Biereagu Sochima
+# GitHub username: kodejuice
+# Date: 18/10/2026
+# Description: Streaming PDN (Portable Draughts Notation) reader and writer for Checkers games
+
+# CheckersPDN.py
+
+import re
+import sys
+import time
+
+from CheckersGame import Checkers, SQUARE_INDEX, PIECE_NAMES, BLACK, WHITE, MAN, KING
+
+# PDN numbers the 32 dark squares 1 to 32, with black on 1-12 and white on 21-32.
+# Black's back row (row 7) is numbered first, every row from its highest column down
+PDN_SQUARES = (None,) + tuple((7 - (n - 1) // 4, 7 - (2 * ((n - 1) % 4) + (1 if (n - 1) // 4 % 2 == 0 else 0)))
+                              for n in range(1, 33))
+PDN_NUMBERS = {coord: n for n, coord in enumerate(PDN_SQUARES) if coord}
+
+RESULTS = ("1-0", "0-1", "2-0", "0-2", "1-1", "1/2-1/2", "*")
+
+TAG = re.compile(r'\[\s*(\w+)\s+"([^"]*)"\s*\]')
+TOKEN = re.compile(r'[{}()]|1/2-1/2|\d+(?:[-x]\d+)+|\d+\.+|\*|[^\s{}()]+')
+MOVE = re.compile(r'\d+(?:[-x]\d+)+$')
+
+
+class PDNGame:
+  """A game read from a PDN file: its tags, its moves (lists of PDN squares) and its result"""
+
+  def __init__(self, tags, moves, result="*"):
+    self.tags = tags
+    self.moves = moves
+    self.result = result
+
+  def hops(self):
+    """Yield every move hop by hop as (start, destination) tuples of (row, col) squares"""
+    for move in self.moves:
+      for start, destination in zip(move, move[1:]):
+        yield PDN_SQUARES[start], PDN_SQUARES[destination]
+
+
+def read_games(lines):
+  """Yield the games of a PDN text given as an iterable of lines (an open file is read lazily),
+  only the game being read is held in memory"""
+  tags, moves = {}, []
+  depth = 0  # nesting of the comments and variations being skipped
+  for line in lines:
+    if not depth and line.lstrip().startswith("["):
+      if moves:
+        yield PDNGame(tags, moves)
+        tags, moves = {}, []
+      tags.update(TAG.findall(line))
+      continue
+    for token in TOKEN.findall(line):
+      if token in "{(":
+        depth += 1
+      elif token in "})":
+        depth = max(0, depth - 1)
+      elif depth:
+        continue
+      elif token in RESULTS:
+        yield PDNGame(tags, moves, token)
+        tags, moves = {}, []
+      elif MOVE.match(token):
+        moves += [[int(square) for square in re.split("[-x]", token)]]
+  if moves or tags:
+    yield PDNGame(tags, moves)
+
+
+def setup(game, fen):
+  """Set the position of a game from a PDN FEN tag, such as "B:W21-32:B1-12" or "W:WK3,18:B12,K30" """
+  bitboards = [0] * len(PIECE_NAMES)
+  side, *lists = fen.strip().rstrip(".").split(":")
+  for pieces in lists:
+    color = WHITE if pieces[:1].upper() == "W" else BLACK
+    for item in filter(None, pieces[1:].split(",")):
+      rank = KING if item[:1].upper() == "K" else MAN
+      first, _, last = item.lstrip("Kk").partition("-")
+      for n in range(int(first), int(last or first) + 1):
+        bitboards[color * 3 + rank] |= 1 << SQUARE_INDEX[PDN_SQUARES[n]]
+  game._set_bitboards(bitboards)
+  game.player_to_move_index = WHITE if side.upper() == "W" else BLACK
+
+
+def replay(pdn_game, game=None):
+  """Play the moves of a PDN game hop by hop with play_game, return the game.
+  A fresh game is used if none is given, raises the game errors on an illegal move"""
+  if game is None:
+    game = Checkers()
+    game.create_player("White", "White")
+    game.create_player("Black", "Black")
+  if "FEN" in pdn_game.tags:
+    setup(game, pdn_game.tags["FEN"])
+  for start, destination in pdn_game.hops():
+    game.play_game(game.players[game.player_to_move_index].player_name, start, destination)
+  return game
+
+
+def format_game(hops, tags=None, result="*", first_color=BLACK, width=79):
+  """Return the PDN text of a game. hops is an iterable of (start, destination, captured pieces, ...)
+  tuples, the plies of a move log for example; the hops of a multiple capture are joined in one move"""
+  moves = []
+  previous = None
+  for start, destination, captures, *_ in hops:
+    if previous and captures and previous[2] and start == previous[1]:
+      moves[-1] += "x%d" % PDN_NUMBERS[destination]
+    else:
+      moves += ["%d%s%d" % (PDN_NUMBERS[start], "x" if captures else "-", PDN_NUMBERS[destination])]
+    previous = (start, destination, captures)
+
+  words = []
+  for i, move in enumerate(moves):
+    ply = i + (first_color == WHITE)
+    if ply % 2 == 0:
+      words += ["%d." % (ply // 2 + 1)]
+    elif i == 0:
+      words += ["1..."]
+    words += [move]
+  words += [result]
+
+  lines = ['[%s "%s"]' % tag for tag in (tags or {}).items()]
+  line = ""
+  for word in words:
+    if line and len(line) + 1 + len(word) > width:
+      lines += [line]
+      line = word
+    else:
+      line = line + " " + word if line else word
+  return "\n".join(lines + [line]) + "\n"
+
+
+def write_games(out, games):
+  """Write games, (hops, tags, result) tuples, to an open text file, separated by blank lines"""
+  for hops, tags, result in games:
+    out.write(format_game(hops, tags, result) + "\n")
+
+
+def benchmark(lines):
+  """Read and replay all the games of a PDN text, return the counts and the games per second"""
+  games = moves = errors = 0
+  begin = time.perf_counter()
+  for pdn_game in read_games(lines):
+    games += 1
+    moves += len(pdn_game.moves)
+    try:
+      replay(pdn_game)
+    except Exception:
+      errors += 1
+  seconds = time.perf_counter() - begin
+  return {
+      "games": games,
+      "moves": moves,
+      "errors": errors,
+      "seconds": seconds,
+      "games_per_sec": games / seconds if seconds else 0.0,
+  }
+
+
+def main(argv):
+  with open(argv[1]) as pdn:
+    stats = benchmark(pdn)
+  print("%(games)d games (%(errors)d rejected), %(moves)d moves in %(seconds).2fs, %(games_per_sec).0f games/sec"
+        % stats)
+
+
+if __name__ == '__main__':
+  main(sys.argv)
@@ -0,0 +1,81 @@
+import io
+import random
+import unittest
+from CheckersPDN import *
+from CheckersGame import new_game
+
+SAMPLE = """[Event "Sample"]
+[Black "Black"]
+[White "White"]
+1. 11-15 {a comment
+over two lines} 22-18 2. 15x22 (2. 15-19 24x15) 25x18 1-0
+
+[Event "Second"]
+[FEN "W:W18:B14,K5"]
+1... 18x9 *
+[Event "Unfinished"]
+1. 9-13
+"""
+
+
+def random_hops(seed, plies=150):
+  """Play a random game, return its hops (start, destination, captures)"""
+  rng = random.Random(seed)
+  game = new_game()
+  hops = []
+  for _ in range(plies):
+    moves = game._get_player_moves(game.player_to_move_index)
+    if not moves:
+      break
+    start, destination, _ = rng.choice(moves)
+    captures = game.play_game(game.players[game.player_to_move_index].player_name, start, destination)
+    hops += [(start, destination, captures)]
+  return hops, game
+
+
+class TestCheckersPDN(unittest.TestCase):
+  def test_squares(self):
+    self.assertEqual(PDN_SQUARES[1], (7, 6))
+    self.assertEqual(PDN_SQUARES[4], (7, 0))
+    self.assertEqual(PDN_SQUARES[5], (6, 7))
+    self.assertEqual(PDN_SQUARES[32], (0, 1))
+    game = new_game()
+    self.assertEqual({n for n in range(1, 33) if game.get_checker_details(PDN_SQUARES[n]) == "Black"},
+                     set(range(1, 13)))
+    self.assertEqual({n for n in range(1, 33) if game.get_checker_details(PDN_SQUARES[n]) == "White"},
+                     set(range(21, 33)))
+
+  def test_read_games(self):
+    games = list(read_games(io.StringIO(SAMPLE)))
+    self.assertEqual([g.tags.get("Event") for g in games], ["Sample", "Second", "Unfinished"])
+    self.assertEqual(games[0].moves, [[11, 15], [22, 18], [15, 22], [25, 18]])
+    self.assertEqual([g.result for g in games], ["1-0", "*", "*"])
+    self.assertEqual(games[1].moves, [[18, 9]])
+
+  def test_replay(self):
+    sample, fen, _ = read_games(io.StringIO(SAMPLE))
+    game = replay(sample)
+    self.assertEqual(game.get_checker_details(PDN_SQUARES[18]), "White")
+    self.assertEqual(game.players[BLACK].captured_pieces_count, 1)
+    self.assertEqual(game.players[WHITE].captured_pieces_count, 1)
+    game = replay(fen)
+    self.assertEqual(game.get_checker_details(PDN_SQUARES[9]), "White")
+    self.assertEqual(game.get_checker_details(PDN_SQUARES[5]), "Black_king")
+    self.assertEqual(game.get_checker_details(PDN_SQUARES[14]), None)
+
+  def test_round_trip(self):
+    out = io.StringIO()
+    games = [random_hops(seed) for seed in range(5)]
+    write_games(out, [(hops, {"Round": str(i)}, "*") for i, (hops, _) in enumerate(games)])
+    out.seek(0)
+    for (_, played), pdn_game in zip(games, read_games(out)):
+      self.assertEqual(replay(pdn_game).board, played.board)
+
+  def test_benchmark(self):
+    stats = benchmark(io.StringIO(SAMPLE))
+    self.assertEqual((stats["games"], stats["moves"], stats["errors"]), (3, 6, 0))
+    self.assertGreater(stats["games_per_sec"], 0)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,148 @@
+# Author: Biereagu Sochima
+# GitHub username: kodejuice
+# Date: 18/10/2026
+# Description: Perft move-generation counter and benchmark for the Checkers game
+
+# CheckersPerft.py
+
+import sys
+import time
+import tracemalloc
+
+from CheckersGame import CaptureCache, new_game
+
+
+# Positions worth counting besides the start position, all with black to move
+POSITIONS = {
+    "friendly_jump": [
+        "-  -  -  -  -  -  -  - ",
+        "-  -  B* -  -  -  -  - ",
+        "-  -  -  B  -  -  -  - ",
+        "-  -  -  -  -  -  -  - ",
+        "-  -  -  -  -  W  -  - ",
+        "-  -  -  -  -  -  -  - ",
+        "-  W* -  -  -  -  -  - ",
+        "Bk -  -  -  -  -  Wk - ",
+    ],
+    "double_piece_jump": [
+        "-  -  -  -  -  -  -  - ",
+        "-  -  B* -  -  -  -  - ",
+        "-  -  -  W  -  -  -  W*",
+        "-  -  -  -  W  -  B  - ",
+        "-  -  -  -  -  -  -  - ",
+        "-  -  -  -  -  -  -  - ",
+        "-  -  -  -  -  -  -  - ",
+        "-  -  -  -  -  -  -  - ",
+    ],
+    "max_capture": [
+        "-  -  -  -  -  -  -  - ",
+        "-  -  -  -  -  -  -  - ",
+        "-  -  -  -  -  W  -  - ",
+        "-  -  -  -  -  -  -  - ",
+        "-  -  -  -  -  W  -  - ",
+        "-  -  -  -  -  -  -  - ",
+        "-  -  -  W  -  W  -  - ",
+        "-  -  -  -  B  -  -  - ",
+    ],
+    "kings": [
+        "-  W  -  -  -  W  -  - ",
+        "-  -  Bk -  -  -  -  - ",
+        "-  -  -  -  -  W  -  Wk",
+        "-  -  -  -  -  -  -  - ",
+        "-  -  -  Wk -  B* -  - ",
+        "-  -  -  -  -  -  -  - ",
+        "-  B  -  W* -  -  -  B ",
+        "-  -  -  -  -  -  -  - ",
+    ],
+}
+
+
+def perft(game, depth):
+  """Return the number of leaf nodes of the move tree of the game to given depth.
+  Every hop of a multiple capture is one ply, the player keeps the turn while it can capture on"""
+  if depth == 0:
+    return 1
+  nodes = 0
+  for start, destination, _ in game.legal_moves():
+    token = game.make_move(start, destination)
+    nodes += perft(game, depth - 1)
+    game.unmake_move(token)
+  return nodes
+
+
+def perft_divide(game, depth):
+  """Return the perft count of every move of the player to move as {(start, destination): nodes}"""
+  counts = {}
+  for start, destination, _ in game.legal_moves():
+    token = game.make_move(start, destination)
+    counts[(start, destination)] = perft(game, depth - 1)
+    game.unmake_move(token)
+  return counts
+
+
+def _perft_allocations(game, depth):
+  """Walk the move tree like perft, return (nodes, bytes) where bytes adds up the peak
+  memory allocated while generating and playing the moves of every node"""
+  if depth == 0:
+    return 1, 0
+  tracemalloc.reset_peak()
+  before = tracemalloc.get_traced_memory()[0]
+  moves = game.legal_moves()
+  allocated = tracemalloc.get_traced_memory()[1] - before
+  nodes = 0
+  for start, destination, _ in moves:
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    token = game.make_move(start, destination)
+    allocated += tracemalloc.get_traced_memory()[1] - before
+    child_nodes, child_allocated = _perft_allocations(game, depth - 1)
+    nodes += child_nodes
+    allocated += child_allocated
+    game.unmake_move(token)
+  return nodes, allocated
+
+
+def benchmark(depth=5, positions=None):
+  """Run perft on the start position and the given positions ({name: layout}, POSITIONS if None).
+  Returns a result dict per position with the node count, nodes/sec and bytes allocated per node.
+  The capture cache is cleared before every run so the numbers are comparable"""
+  if positions is None:
+    positions = POSITIONS
+  runs = [("start", None)] + list(positions.items())
+  results = []
+  for name, layout in runs:
+    game = new_game(layout)
+    game.capture_cache = CaptureCache()
+    begin = time.perf_counter()
+    nodes = perft(game, depth)
+    seconds = time.perf_counter() - begin
+
+    # allocations are measured in a second run, tracemalloc slows everything down
+    game.capture_cache = CaptureCache()
+    tracemalloc.start()
+    try:
+      _, allocated = _perft_allocations(game, depth)
+    finally:
+      tracemalloc.stop()
+
+    results += [{
+        "position": name,
+        "depth": depth,
+        "nodes": nodes,
+        "seconds": seconds,
+        "nodes_per_sec": nodes / seconds if seconds else 0.0,
+        "bytes_per_node": allocated / nodes if nodes else 0.0,
+    }]
+  return results
+
+
+def main(argv):
+  depth = int(argv[1]) if len(argv) > 1 else 5
+  print("%-18s %5s %10s %9s %12s %14s" % ("position", "depth", "nodes", "seconds", "nodes/sec", "bytes/node"))
+  for r in benchmark(depth):
+    print("%-18s %5d %10d %9.3f %12.0f %14.1f" % (
+        r["position"], r["depth"], r["nodes"], r["seconds"], r["nodes_per_sec"], r["bytes_per_node"]))
+
+
+if __name__ == '__main__':
+  main(sys.argv)
@@ -0,0 +1,52 @@
+import unittest
+from CheckersPerft import *
+from CheckersGame import BLACK, new_game
+
+
+class TestCheckersPerft(unittest.TestCase):
+  def test_start_position(self):
+    # Known node counts from the start position
+    game = new_game()
+    self.assertEqual([perft(game, depth) for depth in range(1, 6)], [7, 49, 302, 1469, 7361])
+
+  def test_tricky_positions(self):
+    # Known node counts of the king and triple king positions
+    expected = {
+        "friendly_jump": [3, 11, 35, 79, 234, 608],
+        "double_piece_jump": [3, 8, 11, 20, 63, 148],
+        "max_capture": [1, 1, 1, 2, 4, 8],
+        "kings": [1, 2, 11, 51, 180, 890],
+    }
+    for name, counts in expected.items():
+      game = new_game(POSITIONS[name])
+      self.assertEqual([perft(game, depth) for depth in range(1, 7)], counts, name)
+
+  def test_game_is_restored(self):
+    # perft must leave the game as it found it
+    game = new_game(POSITIONS["kings"])
+    board, key = game.board, game.position_hash()
+    perft(game, 4)
+    self.assertEqual(game.board, board)
+    self.assertEqual(game.position_hash(), key)
+    self.assertEqual(game.player_to_move_index, BLACK)
+    for player in game.players:
+      self.assertEqual(player.get_captured_pieces_count(), 0)
+      self.assertEqual(player.get_king_count(), 0)
+
+  def test_divide(self):
+    # divide splits the count by root move
+    game = new_game()
+    counts = perft_divide(game, 3)
+    self.assertEqual(len(counts), 7)
+    self.assertEqual(sum(counts.values()), perft(game, 3))
+
+  def test_benchmark(self):
+    results = benchmark(2, {"kings": POSITIONS["kings"]})
+    self.assertEqual([r["position"] for r in results], ["start", "kings"])
+    self.assertEqual(results[0]["nodes"], 49)
+    self.assertGreater(results[0]["nodes_per_sec"], 0)
+    self.assertGreater(results[1]["bytes_per_node"], 0)
+
+
+if __name__ == '__main__':
+  unittest.main()
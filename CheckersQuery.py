@@ -0,0 +1,173 @@
+# Author: Biereagu Sochima
+# GitHub username: kodejuice
+# Date: 18/10/2026
+# Description: Bulk legal-move queries over many Checkers positions given as text layouts
+
+# CheckersQuery.py
+
+import json
+import multiprocessing
+import sys
+
+from CheckersGame import Checkers, PIECE_CODES, PIECE_NAMES, LAYOUT_TOKENS, SQUARE_INDEX, SQUARE_COORDS, BLACK, WHITE
+
+# Layout token (lower case) -> piece code, None for an empty square
+TOKEN_CODES = {token: None if name is None else PIECE_CODES[name] for token, name in LAYOUT_TOKENS.items()}
+SIDES = {BLACK: BLACK, WHITE: WHITE, "black": BLACK, "white": WHITE}
+
+# Bit of every (row, col) of a layout, row major
+LAYOUT_BITS = tuple(1 << SQUARE_INDEX[(row, col)] for row in range(8) for col in range(8))
+
+
+class InvalidLayout(ValueError):
+  """Raised when a layout or a side to move cannot be read"""
+  pass
+
+
+def layout_bitboards(layout):
+  """Return the bitboards of a layout of 8 rows of layout tokens (see parse_layout),
+  raise InvalidLayout if it is not one"""
+  bitboards = [0] * len(PIECE_NAMES)
+  if len(layout) != 8:
+    raise InvalidLayout("A layout has 8 rows, not %d" % len(layout))
+  for row, tokens in enumerate(layout):
+    if isinstance(tokens, str):
+      tokens = tokens.split()
+    if len(tokens) != 8:
+      raise InvalidLayout("Row %d has %d squares" % (row, len(tokens)))
+    for col, token in enumerate(tokens):
+      code = TOKEN_CODES.get(token.lower(), -1)
+      if code is None:
+        continue
+      if code < 0:
+        raise InvalidLayout("Invalid token %r at (%d, %d)" % (token, row, col))
+      bitboards[code] |= LAYOUT_BITS[row * 8 + col]
+  return bitboards
+
+
+def _side(side):
+  try:
+    return SIDES[side.lower() if isinstance(side, str) else side]
+  except (KeyError, TypeError):
+    raise InvalidLayout("Invalid side to move %r" % (side,))
+
+
+class QueryEngine:
+  """Answers move queries on one reused game, every query only loads the bitboards of the position"""
+
+  def __init__(self):
+    self.game = Checkers()
+    self.game.create_player("White", "White")
+    self.game.create_player("Black", "Black")
+
+  def load(self, layout, side):
+    """Set the position of the game, raise InvalidLayout if the layout or the side cannot be read"""
+    self.game._set_bitboards(layout_bitboards(layout))
+    self.game.player_to_move_index = _side(side)
+
+  def legal_moves(self, layout, side):
+    """Return the legal moves of side in the layout as [(start, destination, capture_count), ...].
+    When a capture is possible only the moves capturing the most pieces are legal"""
+    self.load(layout, side)
+    return self.game.legal_moves()
+
+  def max_capture_moves(self, layout, side):
+    """Return the best capture of every piece of side that can capture, as [(start, destination, capture_count), ...]"""
+    self.load(layout, side)
+    game = self.game
+    moves = []
+    pieces = game._color_mask(game.player_to_move_index)
+    while pieces:
+      bit = pieces & -pieces
+      pieces ^= bit
+      square = bit.bit_length() - 1
+      moves += [(SQUARE_COORDS[square], SQUARE_COORDS[m[0]], m[1])
+                for m in game._max_capture_moves(square) if m[1] > 0]
+    return moves
+
+
+QUERIES = ("legal_moves", "max_capture_moves")
+
+# Errors of a malformed position (a layout of other types, a row too short, ...), reported as InvalidLayout
+POSITION_ERRORS = (TypeError, AttributeError, IndexError, KeyError, ValueError)
+
+
+def query(positions, kind="legal_moves", engine=None):
+  """Yield the moves of every (layout, side) of positions, in order, computed on one QueryEngine.
+  kind is "legal_moves" or "max_capture_moves", raise ValueError for another kind.
+  A position that cannot be read yields its InvalidLayout error, a position that already is
+  an InvalidLayout (a line main could not read) is yielded as is"""
+  if kind not in QUERIES:
+    raise ValueError("Unknown query %r" % (kind,))
+  engine = engine or QueryEngine()
+  answer = getattr(engine, kind)
+  for position in positions:
+    if isinstance(position, InvalidLayout):
+      yield position
+      continue
+    try:
+      layout, side = position
+      yield answer(layout, side)
+    except InvalidLayout as error:
+      yield error
+    except POSITION_ERRORS as error:
+      yield InvalidLayout("Invalid position: %s" % error)
+
+
+# engine of a worker process of query_parallel
+_worker_engine = None
+
+
+def _query_chunk(task):
+  global _worker_engine
+  if _worker_engine is None:
+    _worker_engine = QueryEngine()
+  kind, positions = task
+  return list(query(positions, kind, _worker_engine))
+
+
+def _chunks(positions, size, kind):
+  chunk = []
+  for position in positions:
+    chunk += [position]
+    if len(chunk) == size:
+      yield kind, chunk
+      chunk = []
+  if chunk:
+    yield kind, chunk
+
+
+def query_parallel(positions, kind="legal_moves", processes=None, chunksize=512):
+  """Like query, on a pool of processes (one per core if processes is None), positions are sent
+  to the workers in chunks of chunksize. Results still come in the order of positions"""
+  if kind not in QUERIES:
+    raise ValueError("Unknown query %r" % (kind,))
+  with multiprocessing.Pool(processes) as pool:
+    for results in pool.imap(_query_chunk, _chunks(positions, chunksize, kind)):
+      yield from results
+
+
+def _read_position(line):
+  """Return the (layout, side) of a JSON line, its InvalidLayout error if it cannot be read"""
+  try:
+    record = json.loads(line)
+    return record["layout"], record["side"]
+  except (ValueError, KeyError, TypeError) as error:
+    return InvalidLayout("Invalid position line: %s" % error)
+
+
+def main(argv):
+  """Read positions as JSON lines {"layout": [...], "side": "Black"} on stdin and write their moves as JSON lines,
+  {"error": ...} for a line that is not a position"""
+  kind = argv[1] if len(argv) > 1 else "legal_moves"
+  processes = int(argv[2]) if len(argv) > 2 else None
+  positions = (_read_position(line) for line in sys.stdin if line.strip())
+  for moves in query_parallel(positions, kind, processes):
+    if isinstance(moves, InvalidLayout):
+      print(json.dumps({"error": str(moves)}))
+    else:
+      print(json.dumps({"moves": moves}))
+
+
+if __name__ == '__main__':
+  main(sys.argv)
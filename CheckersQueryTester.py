@@ -0,0 +1,86 @@
+import io
+import json
+import random
+import sys
+import unittest
+from contextlib import redirect_stdout
+from CheckersQuery import *
+from CheckersGame import new_game
+from CheckersPerft import POSITIONS
+
+NAMES_TOKENS = {name: token for token, name in LAYOUT_TOKENS.items()}
+
+
+def random_positions(count, seed):
+  """Return (layout, side) of positions reached by random games"""
+  rng = random.Random(seed)
+  positions = []
+  game = new_game()
+  for _ in range(count):
+    moves = game.legal_moves()
+    if not moves:
+      game = new_game()
+      continue
+    start, destination, _ = rng.choice(moves)
+    game.play_game(game.players[game.player_to_move_index].player_name, start, destination)
+    layout = [" ".join(NAMES_TOKENS[piece] for piece in row) for row in game.board]
+    positions += [(layout, game.player_to_move_index)]
+  return positions
+
+
+class TestCheckersQuery(unittest.TestCase):
+  def test_matches_game(self):
+    positions = random_positions(150, seed=4)
+    for (layout, side), moves in zip(positions, query(positions)):
+      game = new_game(layout, side)
+      self.assertEqual(moves, game._get_player_moves(side))
+
+  def test_max_capture_moves(self):
+    engine = QueryEngine()
+    self.assertEqual(engine.max_capture_moves(POSITIONS["max_capture"], "Black"), [((7, 4), (5, 6), 3)])
+    self.assertEqual(engine.max_capture_moves(POSITIONS["max_capture"], "White"), [])
+    self.assertEqual(engine.legal_moves(POSITIONS["max_capture"], BLACK), [((7, 4), (5, 6), 3)])
+
+  def test_invalid_positions(self):
+    good = POSITIONS["kings"]
+    results = list(query([(good[:7], BLACK), (good, "Red"), ([row.replace("Bk", "Bx") for row in good], BLACK),
+                          (good, WHITE)]))
+    self.assertTrue(all(isinstance(r, InvalidLayout) for r in results[:3]))
+    self.assertIsInstance(results[3], list)
+    with self.assertRaises(InvalidLayout):
+      layout_bitboards([["-"] * 7] * 8)
+
+    # malformed positions are reported as errors too, the positions after them are still answered
+    results = list(query([(None, BLACK), ([1] * 8, BLACK), ([[1] * 8] * 8, BLACK), (good,), 5, (good, WHITE)]))
+    self.assertTrue(all(isinstance(r, InvalidLayout) for r in results[:5]))
+    self.assertEqual(results[5], QueryEngine().legal_moves(good, WHITE))
+    with self.assertRaises(ValueError):
+      list(query([(good, WHITE)], "best_move"))
+    with self.assertRaises(ValueError):
+      list(query([(good, WHITE)], "load"))
+
+  def test_main(self):
+    good = POSITIONS["kings"]
+    lines = [json.dumps({"layout": good, "side": "White"}), "{not json", json.dumps({"layout": good}),
+             json.dumps([good, "White"]), json.dumps({"layout": None, "side": "Black"})]
+    stdin, sys.stdin = sys.stdin, io.StringIO("\n".join(lines) + "\n")
+    output = io.StringIO()
+    try:
+      with redirect_stdout(output):
+        main(["CheckersQuery.py", "legal_moves", "1"])
+    finally:
+      sys.stdin = stdin
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    self.assertEqual(len(records), 5)
+    self.assertEqual(len(records[0]["moves"]), len(QueryEngine().legal_moves(good, WHITE)))
+    self.assertTrue(all(set(record) == {"error"} for record in records[1:]))
+
+  def test_parallel(self):
+    positions = random_positions(60, seed=9)
+    self.assertEqual(list(query_parallel(positions, processes=2, chunksize=7)), list(query(positions)))
+    self.assertEqual(list(query_parallel(positions, "max_capture_moves", processes=2, chunksize=16)),
+                     list(query(positions, "max_capture_moves")))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,223 @@
+# Author: Biereagu Sochima
+# GitHub username: kodejuice
+# Date: 18/10/2026
+# Description: Append-only binary move log of Checkers games with fast replay
+
+# CheckersRecord.py
+
+import mmap
+import os
+import struct
+from bisect import bisect_right
+
+from CheckersGame import Checkers, PIECES, PIECE_NAMES, PIECE_CODES, SQUARE_COORDS, SQUARE_INDEX, BLACK, WHITE
+
+# A log is a header followed by one fixed-size record per ply:
+#   start, destination (row * 8 + col), captured pieces, flags
+# flags: bit 0 the color that moved, bit 1 set if that player keeps the turn,
+#        bits 2-3 the promotion (0 none, 1 to king, 2 to triple king)
+LOG_MAGIC = b"CKLG"
+LOG_HEADER = struct.Struct("<4sBxH")
+RECORD = struct.Struct("<BBBB")
+VERSION = 1
+
+KEEPS_TURN = 2
+PROMOTION_SHIFT = 2
+
+# Plies store squares as row * 8 + col whatever the game uses internally
+SQUARE_COORDS_64 = tuple(divmod(square, 8) for square in range(64))
+
+# The snapshot file (log path + ".snap") holds the position every snapshot_interval plies:
+#   ply, player to move, king / triple king / captured counts of black then white,
+#   64 cells of 4 bits (0 empty, 1 + piece code)
+SNAP_MAGIC = b"CKSN"
+SNAP_HEADER = struct.Struct("<4sBxxx")
+SNAPSHOT = struct.Struct("<IB6b32s")
+
+
+def pack_position(game):
+  """Return the cells of the game position packed in 32 bytes, two cells per byte"""
+  cells = bytearray(64)
+  for code, mask in enumerate(game._bitboards):
+    while mask:
+      bit = mask & -mask
+      mask ^= bit
+      row, col = SQUARE_COORDS[bit.bit_length() - 1]
+      cells[row * 8 + col] = code + 1
+  return bytes(cells[i] | cells[i + 1] << 4 for i in range(0, 64, 2))
+
+
+def unpack_position(data):
+  """Return the bitboards of a position packed by pack_position"""
+  bitboards = [0] * len(PIECE_NAMES)
+  for i, byte in enumerate(data):
+    if byte & 15:
+      bitboards[(byte & 15) - 1] |= 1 << SQUARE_INDEX[divmod(2 * i, 8)]
+    if byte >> 4:
+      bitboards[(byte >> 4) - 1] |= 1 << SQUARE_INDEX[divmod(2 * i + 1, 8)]
+  return bitboards
+
+
+def _counters(game):
+  return [count for player in game.players
+          for count in (player.king_count, player.triple_king_count, player.captured_pieces_count)]
+
+
+class MoveLogWriter:
+  """Appends the plies of one game to a move log, and a position snapshot every snapshot_interval plies.
+  The position of the game when the log is created is the first snapshot"""
+
+  def __init__(self, path, game, snapshot_interval=32):
+    self.path = path
+    self.snapshot_interval = snapshot_interval
+    self.plies = 0
+    self._log = open(path, "ab")
+    self._snapshots = open(path + ".snap", "ab")
+    if self._log.tell() == 0:
+      self._log.write(LOG_HEADER.pack(LOG_MAGIC, VERSION, snapshot_interval))
+      self._snapshots.write(SNAP_HEADER.pack(SNAP_MAGIC, VERSION))
+      self.snapshot(game)
+    else:
+      self.plies = (self._log.tell() - LOG_HEADER.size) // RECORD.size
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc):
+    self.close()
+
+  def append(self, start, destination, captures, color, keeps_turn, promotion, game=None):
+    """Append one ply. promotion is 0, KING or TRIPLE_KING. game, the game after the ply,
+    is needed to take the periodic snapshots"""
+    flags = color | (KEEPS_TURN if keeps_turn else 0) | promotion << PROMOTION_SHIFT
+    self._log.write(RECORD.pack(start[0] * 8 + start[1], destination[0] * 8 + destination[1], captures, flags))
+    self.plies += 1
+    if game is not None and self.plies % self.snapshot_interval == 0:
+      self.snapshot(game)
+
+  def snapshot(self, game):
+    """Write the current position of the game as the snapshot of the current ply"""
+    self._snapshots.write(SNAPSHOT.pack(self.plies, game.player_to_move_index, *_counters(game),
+                                        pack_position(game)))
+
+  def flush(self):
+    self._log.flush()
+    self._snapshots.flush()
+
+  def close(self):
+    self._log.close()
+    self._snapshots.close()
+
+
+class RecordedGame:
+  """Wraps a Checkers game, every successful play_game call is appended to a move log"""
+
+  def __init__(self, game, path, snapshot_interval=32):
+    self.game = game
+    self.log = MoveLogWriter(path, game, snapshot_interval)
+
+  def __getattr__(self, name):
+    return getattr(self.game, name)
+
+  def play_game(self, player_name, start, destination):
+    game = self.game
+    if isinstance(destination, list):
+      # the game checks the whole capture path first, which is then played and logged hop by hop
+      saved = game.snapshot()
+      game.play_game(player_name, start, destination)
+      game.restore(saved)
+      captures = 0
+      for hop in destination:
+        captures += self._play_hop(player_name, start, tuple(hop))
+        start = hop
+      return captures
+    return self._play_hop(player_name, start, destination)
+
+  def _play_hop(self, player_name, start, destination):
+    game = self.game
+    color = game.player_to_move_index
+    before = game.get_checker_details(start) if game._in_bound(start) else None
+    captures = game.play_game(player_name, start, destination)
+    after = game.get_checker_details(destination)
+    # the rank the piece was promoted to, KING or TRIPLE_KING
+    promotion = PIECES[PIECE_CODES[after]].rank if after != before else 0
+    self.log.append(start, destination, captures, color, game.player_to_move_index == color, promotion, game)
+    return captures
+
+  def close(self):
+    self.log.close()
+
+
+class MoveLogReader:
+  """Random access to the plies of a move log and fast rebuilding of the position at any ply.
+  The log and its snapshots are memory mapped"""
+
+  def __init__(self, path):
+    with open(path, "rb") as log:
+      self._log = mmap.mmap(log.fileno(), 0, access=mmap.ACCESS_READ)
+    with open(path + ".snap", "rb") as snapshots:
+      self._snapshots = mmap.mmap(snapshots.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, self.snapshot_interval = LOG_HEADER.unpack_from(self._log, 0)
+    if magic != LOG_MAGIC or SNAP_HEADER.unpack_from(self._snapshots, 0)[0] != SNAP_MAGIC:
+      raise ValueError(path + " is not a move log")
+    self._snapshot_count = (len(self._snapshots) - SNAP_HEADER.size) // SNAPSHOT.size
+    self._snapshot_plies = [SNAPSHOT.unpack_from(self._snapshots, self._snapshot_offset(i))[0]
+                            for i in range(self._snapshot_count)]
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc):
+    self.close()
+
+  def __len__(self):
+    return (len(self._log) - LOG_HEADER.size) // RECORD.size
+
+  def __getitem__(self, ply):
+    """Return ply number ply (0 is the first) as (start, destination, captures, color, keeps_turn, promotion)"""
+    if not 0 <= ply < len(self):
+      raise IndexError("ply out of range")
+    start, destination, captures, flags = RECORD.unpack_from(self._log, LOG_HEADER.size + ply * RECORD.size)
+    return (SQUARE_COORDS_64[start], SQUARE_COORDS_64[destination], captures,
+            flags & 1, bool(flags & KEEPS_TURN), flags >> PROMOTION_SHIFT)
+
+  def __iter__(self):
+    for ply in range(len(self)):
+      yield self[ply]
+
+  def position(self, ply, game=None):
+    """Return a game in the position after the first ply plies (0 is the position the log starts from).
+    The position is rebuilt from the closest snapshot, game is reused if given"""
+    if not 0 <= ply <= len(self):
+      raise IndexError("ply out of range")
+    if game is None:
+      game = Checkers()
+      game.create_player("White", "White")
+      game.create_player("Black", "Black")
+    index = bisect_right(self._snapshot_plies, ply) - 1
+    snapshot_ply, side, *counters, cells = SNAPSHOT.unpack_from(self._snapshots, self._snapshot_offset(index))
+    game._set_bitboards(unpack_position(cells))
+    for player, offset in ((game.players[BLACK], 0), (game.players[WHITE], 3)):
+      player.king_count, player.triple_king_count, player.captured_pieces_count = counters[offset:offset + 3]
+
+    log = self._log
+    for i in range(snapshot_ply, ply):
+      start, destination, captures, flags = RECORD.unpack_from(log, LOG_HEADER.size + i * RECORD.size)
+      color = flags & 1
+      game.player_to_move_index = color
+      game.make_move(SQUARE_COORDS_64[start], SQUARE_COORDS_64[destination])
+      side = color if flags & KEEPS_TURN else 1 - color
+    game.player_to_move_index = side
+    return game
+
+  def close(self):
+    self._log.close()
+    self._snapshots.close()
+
+  def _snapshot_offset(self, index):
+    return SNAP_HEADER.size + index * SNAPSHOT.size
+
+
+def log_size(path):
+  """Return the number of plies in a move log without mapping it"""
+  return (os.path.getsize(path) - LOG_HEADER.size) // RECORD.size
@@ -0,0 +1,109 @@
+import os
+import random
+import tempfile
+import unittest
+from CheckersRecord import *
+from CheckersGame import InvalidSquare, KING, TRIPLE_KING, new_game
+from CheckersPerft import POSITIONS
+
+
+def play_random(recorded, plies, seed):
+  """Play random legal moves, return the state (board, player to move, counters) after every ply"""
+  rng = random.Random(seed)
+  game = recorded.game
+  states = [state(game)]
+  for _ in range(plies):
+    moves = game._get_player_moves(game.player_to_move_index)
+    if not moves:
+      break
+    start, destination, _ = rng.choice(moves)
+    recorded.play_game(game.players[game.player_to_move_index].player_name, start, destination)
+    states += [state(game)]
+  return states
+
+
+def state(game):
+  return game.board, game.player_to_move_index, game.position_hash(), [
+      (p.king_count, p.triple_king_count, p.captured_pieces_count) for p in game.players]
+
+
+class TestCheckersRecord(unittest.TestCase):
+  def setUp(self):
+    directory = tempfile.mkdtemp()
+    self.path = os.path.join(directory, "game.log")
+
+  def test_seek(self):
+    recorded = RecordedGame(new_game(), self.path, snapshot_interval=8)
+    states = play_random(recorded, 200, seed=3)
+    recorded.close()
+
+    with MoveLogReader(self.path) as reader:
+      self.assertEqual(len(reader), len(states) - 1)
+      self.assertEqual(log_size(self.path), len(reader))
+      for ply in [0, 1, 7, 8, 9, len(reader)] + list(range(0, len(reader), 5)):
+        self.assertEqual(state(reader.position(ply)), states[ply])
+      self.assertRaises(IndexError, reader.position, len(reader) + 1)
+
+  def test_records(self):
+    game = new_game()
+    recorded = RecordedGame(game, self.path)
+    recorded.play_game("Black", (5, 0), (4, 1))
+    recorded.play_game("White", (2, 3), (3, 2))
+    recorded.play_game("Black", (4, 1), (2, 3))
+    recorded.close()
+    with MoveLogReader(self.path) as reader:
+      self.assertEqual(list(reader), [((5, 0), (4, 1), 0, BLACK, False, 0),
+                                      ((2, 3), (3, 2), 0, WHITE, False, 0),
+                                      ((4, 1), (2, 3), 1, BLACK, False, 0)])
+      self.assertRaises(IndexError, lambda: reader[3])
+
+  def test_promotion_records(self):
+    rows = [["-"] * 8 for _ in range(8)]
+    rows[1][2], rows[6][2], rows[2][7] = "B", "Bk", "W"
+    recorded = RecordedGame(new_game(rows), self.path)
+    recorded.play_game("Black", (1, 2), (0, 1))
+    recorded.play_game("White", (2, 7), (3, 6))
+    recorded.play_game("Black", (6, 2), (7, 1))
+    recorded.close()
+    self.assertEqual(recorded.get_checker_details((7, 1)), "Black_Triple_King")
+    with MoveLogReader(self.path) as reader:
+      self.assertEqual([ply[5] for ply in reader], [KING, 0, TRIPLE_KING])
+
+  def test_capture_path(self):
+    rows = [["-"] * 8 for _ in range(8)]
+    rows[7][4], rows[6][5], rows[4][5], rows[2][5], rows[6][3] = "B", "W", "W", "W", "W"
+    recorded = RecordedGame(new_game(rows), self.path)
+    with self.assertRaises(InvalidSquare):
+      recorded.play_game("Black", (7, 4), [(5, 6), (3, 4)])
+    self.assertEqual(recorded.log.plies, 0)
+    self.assertEqual(recorded.play_game("Black", (7, 4), [(5, 6), (3, 4), (1, 6)]), 3)
+    recorded.close()
+    with MoveLogReader(self.path) as reader:
+      self.assertEqual(list(reader), [((7, 4), (5, 6), 1, BLACK, True, 0),
+                                      ((5, 6), (3, 4), 1, BLACK, True, 0),
+                                      ((3, 4), (1, 6), 1, BLACK, False, 0)])
+      self.assertEqual(state(reader.position(3)), state(recorded.game))
+
+  def test_custom_start_and_append(self):
+    # the log starts from the position of the game, and can be reopened to append more plies
+    game = new_game(POSITIONS["kings"])
+    recorded = RecordedGame(game, self.path, snapshot_interval=4)
+    states = play_random(recorded, 10, seed=1)
+    recorded.close()
+    recorded = RecordedGame(game, self.path, snapshot_interval=4)
+    self.assertEqual(recorded.log.plies, len(states) - 1)
+    states += play_random(recorded, 10, seed=2)[1:]
+    recorded.close()
+
+    with MoveLogReader(self.path) as reader:
+      self.assertEqual(len(reader), len(states) - 1)
+      for ply in range(len(states)):
+        self.assertEqual(state(reader.position(ply)), states[ply])
+
+  def test_pack_position(self):
+    game = new_game(POSITIONS["friendly_jump"])
+    self.assertEqual(unpack_position(pack_position(game)), game._bitboards)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,126 @@
+# Author: Biereagu Sochima
+# GitHub username: kodejuice
+# Date: 18/10/2026
+# Description: Self-play runner playing many Checkers games on all cores
+
+# CheckersSelfPlay.py
+
+import multiprocessing
+import random
+import sys
+import time
+
+from CheckersGame import Checkers, BLACK, WHITE
+from CheckersEngine import SearchEngine
+
+NOT_ENDED = "Game has not ended"
+
+
+def game_seeds(seed, games):
+  """Return the seed of every game of a run, the same run seed always gives the same game seeds"""
+  rng = random.Random(seed)
+  return [rng.getrandbits(64) for _ in range(games)]
+
+
+def play_one(task):
+  """Play one game, task is (game_index, seed, max_plies, engine_depth).
+  Moves are picked at random from the legal moves, or by the search engine to engine_depth
+  after a few random opening moves. Returns the result of the game as a dict, "moves" holds
+  the (start, destination) of every ply"""
+  game_index, seed, max_plies, engine_depth = task
+  rng = random.Random(seed)
+  engine = SearchEngine(max_depth=engine_depth) if engine_depth else None
+  random_plies = rng.randrange(2, 8)
+
+  game = Checkers()
+  players = [None, None]
+  players[WHITE] = game.create_player("White", "White")
+  players[BLACK] = game.create_player("Black", "Black")
+
+  plies = 0
+  moves = []
+  winner = game.game_winner()
+  while winner == NOT_ENDED and plies < max_plies:
+    side = game.player_to_move_index
+    if engine and plies >= random_plies:
+      # fixed depth and no time limit keep the game reproducible
+      start, destination = engine.search(game, time_limit=3600)
+    else:
+      start, destination, _ = rng.choice(game._get_player_moves(side))
+    game.play_game(players[side].player_name, start, destination)
+    moves += [(start, destination)]
+    plies += 1
+    winner = game.game_winner()
+
+  return {
+      "game": game_index,
+      "seed": seed,
+      "winner": None if winner == NOT_ENDED else winner,
+      "plies": plies,
+      "captures": [p.get_captured_pieces_count() for p in players],
+      "kings": [p.get_king_count() for p in players],
+      "triple_kings": [p.get_triple_king_count() for p in players],
+      "moves": moves,
+  }
+
+
+def self_play(games, seed=0, processes=None, max_plies=300, engine_depth=0, chunksize=4):
+  """Play games on a pool of processes (one per core if processes is None) and yield the
+  result of every game as soon as it is finished. Results do not come in game order,
+  the "game" key tells which game a result belongs to"""
+  tasks = [(index, game_seed, max_plies, engine_depth)
+           for index, game_seed in enumerate(game_seeds(seed, games))]
+  if processes == 1:
+    for task in tasks:
+      yield play_one(task)
+    return
+  with multiprocessing.Pool(processes) as pool:
+    for result in pool.imap_unordered(play_one, tasks, chunksize):
+      yield result
+
+
+def run(games, seed=0, processes=None, max_plies=300, engine_depth=0, on_result=None):
+  """Play games with self_play and return the aggregate statistics as a dict.
+  on_result, if given, is called with every game result as it arrives"""
+  summary = {
+      "games": 0,
+      "wins": {"Black": 0, "White": 0},
+      "draws": 0,
+      "plies": 0,
+      "captures": [0, 0],
+      "kings": [0, 0],
+      "triple_kings": [0, 0],
+  }
+  begin = time.perf_counter()
+  for result in self_play(games, seed, processes, max_plies, engine_depth):
+    summary["games"] += 1
+    summary["plies"] += result["plies"]
+    if result["winner"] is None:
+      summary["draws"] += 1
+    else:
+      summary["wins"][result["winner"]] += 1
+    for key in ("captures", "kings", "triple_kings"):
+      for color in (BLACK, WHITE):
+        summary[key][color] += result[key][color]
+    if on_result:
+      on_result(result)
+  summary["seconds"] = time.perf_counter() - begin
+  summary["games_per_sec"] = summary["games"] / summary["seconds"] if summary["seconds"] else 0.0
+  return summary
+
+
+def main(argv):
+  games = int(argv[1]) if len(argv) > 1 else 1000
+  processes = int(argv[2]) if len(argv) > 2 else None
+  engine_depth = int(argv[3]) if len(argv) > 3 else 0
+
+  def report(result):
+    print("game %d: winner %s after %d plies" % (result["game"], result["winner"], result["plies"]))
+
+  summary = run(games, processes=processes, engine_depth=engine_depth, on_result=report)
+  print("%d games in %.1fs, %.1f games/sec" % (summary["games"], summary["seconds"], summary["games_per_sec"]))
+  print("black wins %(Black)d, white wins %(White)d" % summary["wins"], "draws %d" % summary["draws"])
+
+
+if __name__ == '__main__':
+  main(sys.argv)
@@ -0,0 +1,36 @@
+import unittest
+from CheckersSelfPlay import *
+
+
+class TestCheckersSelfPlay(unittest.TestCase):
+  def test_play_one(self):
+    result = play_one((0, 12345, 300, 0))
+    self.assertEqual(result["game"], 0)
+    self.assertIn(result["winner"], ("Black", "White", None))
+    self.assertGreater(result["plies"], 0)
+    self.assertEqual(len(result["captures"]), 2)
+
+  def test_deterministic(self):
+    # the same seed plays the same games, on any number of processes
+    serial = sorted(self_play(6, seed=7, processes=1), key=lambda r: r["game"])
+    parallel = sorted(self_play(6, seed=7, processes=2), key=lambda r: r["game"])
+    self.assertEqual(serial, parallel)
+    self.assertNotEqual(serial, sorted(self_play(6, seed=8, processes=1), key=lambda r: r["game"]))
+
+  def test_engine_games(self):
+    results = list(self_play(2, seed=1, processes=1, max_plies=20, engine_depth=1))
+    self.assertEqual(sorted(r["game"] for r in results), [0, 1])
+    self.assertEqual(results, list(self_play(2, seed=1, processes=1, max_plies=20, engine_depth=1)))
+
+  def test_run_summary(self):
+    streamed = []
+    summary = run(4, seed=3, processes=2, on_result=streamed.append)
+    self.assertEqual(summary["games"], 4)
+    self.assertEqual(len(streamed), 4)
+    self.assertEqual(summary["wins"]["Black"] + summary["wins"]["White"] + summary["draws"], 4)
+    self.assertEqual(summary["plies"], sum(r["plies"] for r in streamed))
+    self.assertGreater(summary["games_per_sec"], 0)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,211 @@
+# Author: Biereagu Sochima
+# GitHub username: kodejuice
+# Date: 18/10/2026
+# Description: asyncio line-protocol server hosting many Checkers games in one process
+
+# CheckersServer.py
+
+import asyncio
+import itertools
+import sys
+import time
+
+from CheckersGame import Checkers, OutofTurn, InvalidSquare, InvalidPlayer
+
+# Protocol, one request per line, squares are written row,col:
+#   NEW <white player> <black player>        -> OK <session>
+#   MOVE <session> <player> <row,col> <row,col> -> OK <captured pieces>
+#   MOVE <session> <player> <row,col> <row,col> <row,col> ... -> OK <captured pieces of the whole capture path>
+#   CAPTURES <session> <row,col>            -> OK <row,col>-<row,col>-... for every maximum capture path
+#   DETAILS <session> <row,col>              -> OK <piece or None>
+#   BOARD <session>                          -> OK <board as print_board prints it>
+#   WINNER <session>                         -> OK <game_winner result>
+#   MOVES <session>                          -> OK <player to move> <row,col>-<row,col> ...
+#   CLOSE <session>                          -> OK
+#   QUIT                                     -> closes the connection
+# Errors are answered with ERR <error name> <message>, game errors keep the exception name.
+
+
+# Number of arguments of every command, at least that many for the commands of VARIADIC_COMMANDS
+COMMAND_ARGS = {"NEW": 2, "MOVE": 4, "DETAILS": 2, "BOARD": 1, "WINNER": 1, "MOVES": 1, "CAPTURES": 2, "CLOSE": 1}
+VARIADIC_COMMANDS = {"MOVE"}
+
+
+class UnknownSession(Exception):
+  """Raised when a request names a session that does not exist (or was evicted)"""
+  pass
+
+
+class BadRequest(Exception):
+  """Raised when a request line cannot be understood"""
+  pass
+
+
+class Session:
+  """A game hosted by the server. The lock serializes the requests of the game"""
+
+  def __init__(self, session_id, white_name, black_name):
+    self.session_id = session_id
+    self.game = Checkers()
+    self.game.create_player(white_name, "White")
+    self.game.create_player(black_name, "Black")
+    self.lock = asyncio.Lock()
+    self.last_used = time.monotonic()
+
+
+class SessionManager:
+  """Hosts the sessions of the server and evicts the ones that have been idle for too long"""
+
+  def __init__(self, max_idle=600.0, executor=None):
+    self.max_idle = max_idle
+    self.executor = executor
+    self.sessions = {}
+    self.eviction = None
+    self._ids = itertools.count(1)
+
+  def create(self, white_name, black_name):
+    """Start a new game and return its session"""
+    session = Session(str(next(self._ids)), white_name, black_name)
+    self.sessions[session.session_id] = session
+    return session
+
+  def get(self, session_id):
+    """Return the session with given id, raise UnknownSession if there is none"""
+    session = self.sessions.get(session_id)
+    if session is None:
+      raise UnknownSession("No session " + session_id)
+    return session
+
+  def close(self, session_id):
+    """End the session with given id"""
+    self.get(session_id)
+    del self.sessions[session_id]
+
+  def evict_idle(self, now=None):
+    """Remove the sessions idle for longer than max_idle, return the number of removed sessions"""
+    now = time.monotonic() if now is None else now
+    idle = [s.session_id for s in self.sessions.values()
+            if now - s.last_used > self.max_idle and not s.lock.locked()]
+    for session_id in idle:
+      del self.sessions[session_id]
+    return len(idle)
+
+  def start_eviction(self, interval):
+    """Evict idle sessions every interval seconds in a background task, until stop() is called"""
+    self.eviction = asyncio.ensure_future(self._run_eviction(interval))
+
+  def stop(self):
+    """Stop the eviction task"""
+    if self.eviction:
+      self.eviction.cancel()
+      self.eviction = None
+
+  async def _run_eviction(self, interval):
+    while True:
+      await asyncio.sleep(interval)
+      self.evict_idle()
+
+  async def handle(self, line):
+    """Answer one request line"""
+    words = line.split()
+    if not words:
+      raise BadRequest("Empty request")
+    command, args = words[0].upper(), words[1:]
+    if command not in COMMAND_ARGS:
+      raise BadRequest("Unknown command " + command)
+    if len(args) != COMMAND_ARGS[command] and not (command in VARIADIC_COMMANDS and len(args) > COMMAND_ARGS[command]):
+      raise BadRequest("%s expects %d arguments" % (command, COMMAND_ARGS[command]))
+
+    if command == "NEW":
+      return self.create(args[0], args[1]).session_id
+
+    session = self.get(args[0])
+    if command == "CLOSE":
+      self.close(session.session_id)
+      return ""
+
+    async with session.lock:
+      session.last_used = time.monotonic()
+      game = session.game
+      if command == "MOVE":
+        start, path = _square(args[2]), [_square(arg) for arg in args[3:]]
+        # a single destination keeps the hop by hop protocol
+        destination = path if len(path) > 1 else path[0]
+        return str(await self._run(game.play_game, args[1], start, destination))
+      if command == "CAPTURES":
+        paths = await self._run(game.get_capture_paths, _square(args[1]))
+        return " ".join("-".join("%d,%d" % square for square in path) for path in paths)
+      if command == "DETAILS":
+        return str(game.get_checker_details(_square(args[1])))
+      if command == "BOARD":
+        # the text print_board writes
+        return str(game.board)
+      if command == "WINNER":
+        return await self._run(game.game_winner)
+      return await self._run(_moves_reply, game)
+
+  async def _run(self, function, *args):
+    """Run a call that may search the game in the executor, so the event loop is never blocked.
+    The default executor is a thread pool: calls of different sessions run at the same time,
+    the session lock keeps the calls of one game apart and the shared capture cache is locked"""
+    return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+
+
+def _square(text):
+  """Parse a row,col square"""
+  try:
+    row, col = text.split(",")
+    return int(row), int(col)
+  except ValueError:
+    raise BadRequest("Invalid square " + text)
+
+
+def _moves_reply(game):
+  """Return the player to move and its legal moves as a reply"""
+  side = game.player_to_move_index
+  moves = ["%d,%d-%d,%d" % (start + destination) for start, destination, _ in game._get_player_moves(side)]
+  return " ".join([game.players[side].player_name] + moves)
+
+
+async def _serve_client(manager, reader, writer):
+  """Answer the requests of one connection until it is closed"""
+  try:
+    while True:
+      line = await reader.readline()
+      if not line or line.strip().upper() == b"QUIT":
+        break
+      try:
+        reply = "OK " + await manager.handle(line.decode())
+      except (OutofTurn, InvalidSquare, InvalidPlayer, UnknownSession, BadRequest) as error:
+        reply = "ERR %s %s" % (type(error).__name__, error)
+      except Exception as error:
+        reply = "ERR ServerError %s" % error
+      writer.write(reply.rstrip().encode() + b"\n")
+      await writer.drain()
+  except ConnectionError:
+    pass
+  finally:
+    writer.close()
+
+
+async def start_server(host="127.0.0.1", port=8162, max_idle=600.0, evict_interval=30.0, executor=None):
+  """Start the server, return (server, manager). Call manager.stop() when closing the server"""
+  manager = SessionManager(max_idle, executor)
+  server = await asyncio.start_server(lambda r, w: _serve_client(manager, r, w), host, port)
+  manager.start_eviction(evict_interval)
+  return server, manager
+
+
+async def serve(host="127.0.0.1", port=8162):
+  server, manager = await start_server(host, port)
+  print("Serving on", ", ".join(str(s.getsockname()) for s in server.sockets))
+  try:
+    async with server:
+      await server.serve_forever()
+  finally:
+    manager.stop()
+
+
+if __name__ == '__main__':
+  port = int(sys.argv[1]) if len(sys.argv) > 1 else 8162
+  asyncio.run(serve(port=port))
@@ -0,0 +1,112 @@
+import asyncio
+import random
+import unittest
+
+from CheckersServer import *
+import CheckersLoadGen
+
+
+class TestCheckersServer(unittest.IsolatedAsyncioTestCase):
+  async def asyncSetUp(self):
+    self.server, self.manager = await start_server(port=0, max_idle=60.0)
+    port = self.server.sockets[0].getsockname()[1]
+    self.port = port
+    self.reader, self.writer = await asyncio.open_connection("127.0.0.1", port)
+
+  async def asyncTearDown(self):
+    self.writer.close()
+    self.manager.stop()
+    self.server.close()
+    await self.server.wait_closed()
+
+  async def request(self, line):
+    self.writer.write(line.encode() + b"\n")
+    await self.writer.drain()
+    return (await self.reader.readline()).decode().rstrip("\n")
+
+  async def test_play(self):
+    session = (await self.request("NEW Adam Lucy")).split()[1]
+    self.assertEqual(await self.request("DETAILS %s 0,1" % session), "OK White")
+    self.assertEqual(await self.request("DETAILS %s 3,1" % session), "OK None")
+    self.assertEqual(await self.request("MOVE %s Lucy 5,6 4,7" % session), "OK 0")
+    self.assertEqual(await self.request("WINNER %s" % session), "OK Game has not ended")
+    reply = await self.request("MOVES %s" % session)
+    self.assertTrue(reply.startswith("OK Adam "))
+    self.assertIn("2,1-3,0", reply.split())
+    board = await self.request("BOARD %s" % session)
+    self.assertEqual(board, "OK " + str(self.manager.get(session).game.board))
+
+  async def test_capture_path(self):
+    session = (await self.request("NEW Adam Lucy")).split()[1]
+    for line in ("Lucy 5,6 4,7", "Adam 2,3 3,4", "Lucy 6,5 5,6", "Adam 1,2 2,3", "Lucy 5,4 4,3", "Adam 3,4 4,5"):
+      self.assertEqual(await self.request("MOVE %s %s" % (session, line)), "OK 0")
+    self.assertEqual(await self.request("CAPTURES %s 5,6" % session), "OK 3,4-1,2")
+    self.assertTrue((await self.request("MOVE %s Lucy 5,6 3,4 2,5" % session)).startswith("ERR InvalidSquare"))
+    self.assertEqual(await self.request("MOVE %s Lucy 5,6 3,4 1,2" % session), "OK 2")
+    self.assertEqual(await self.request("CAPTURES %s 1,2" % session), "OK")
+    self.assertTrue((await self.request("MOVES %s" % session)).startswith("OK Adam "))
+
+  async def test_errors(self):
+    session = (await self.request("NEW Adam Lucy")).split()[1]
+    self.assertTrue((await self.request("MOVE %s Adam 2,1 3,0" % session)).startswith("ERR OutofTurn"))
+    self.assertTrue((await self.request("MOVE %s John 2,1 3,0" % session)).startswith("ERR InvalidPlayer"))
+    self.assertTrue((await self.request("MOVE %s Lucy 9,9 3,0" % session)).startswith("ERR InvalidSquare"))
+    self.assertTrue((await self.request("DETAILS %s 9,9" % session)).startswith("ERR InvalidSquare"))
+    self.assertTrue((await self.request("WINNER 999")).startswith("ERR UnknownSession"))
+    self.assertTrue((await self.request("JUMP %s" % session)).startswith("ERR BadRequest"))
+    self.assertTrue((await self.request("DETAILS %s x" % session)).startswith("ERR BadRequest"))
+
+  async def test_close_and_evict(self):
+    first = (await self.request("NEW Adam Lucy")).split()[1]
+    second = (await self.request("NEW Adam Lucy")).split()[1]
+    self.assertEqual(await self.request("CLOSE %s" % first), "OK")
+    self.assertTrue((await self.request("BOARD %s" % first)).startswith("ERR UnknownSession"))
+
+    session = self.manager.get(second)
+    self.assertEqual(self.manager.evict_idle(session.last_used + 30), 0)
+    self.assertEqual(self.manager.evict_idle(session.last_used + 61), 1)
+    self.assertEqual(self.manager.sessions, {})
+
+  async def test_concurrent_sessions(self):
+    async def play(seed):
+      # every session is played on its own connection, the game calls run in the default thread pool
+      rng = random.Random(seed)
+      reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+
+      async def request(line):
+        writer.write(line.encode() + b"\n")
+        await writer.drain()
+        return (await reader.readline()).decode().rstrip("\n")
+
+      session = (await request("NEW Adam Lucy")).split()[1]
+      replay = Checkers()
+      replay.create_player("Adam", "White")
+      replay.create_player("Lucy", "Black")
+      for _ in range(40):
+        words = (await request("MOVES %s" % session)).split()[1:]
+        if len(words) < 2:
+          break
+        start, destination = words[rng.randrange(1, len(words))].split("-")
+        await request("CAPTURES %s %s" % (session, start))
+        reply = await request("MOVE %s %s %s %s" % (session, words[0], start, destination))
+        self.assertTrue(reply.startswith("OK "), reply)
+        captured = replay.play_game(words[0], *[tuple(map(int, square.split(","))) for square in (start, destination)])
+        self.assertEqual(reply, "OK %d" % captured)
+      board = await request("BOARD %s" % session)
+      writer.close()
+      return session, board, str(replay.board)
+
+    for session, board, expected in await asyncio.gather(*[play(seed) for seed in range(8)]):
+      self.assertEqual(board, "OK " + expected)
+      self.assertEqual(board, "OK " + str(self.manager.get(session).game.board))
+
+  async def test_load_generator(self):
+    stats = await CheckersLoadGen.run(port=self.port, connections=5, games_per_connection=1)
+    self.assertEqual(stats["games"], 5)
+    self.assertGreater(stats["moves"], 0)
+    self.assertLessEqual(stats["p50"], stats["p99"])
+    self.assertEqual(self.manager.sessions, {})
+
+
+if __name__ == '__main__':
+  unittest.main()
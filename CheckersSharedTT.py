@@ -0,0 +1,156 @@
+# Author: Biereagu Sochima
+# GitHub username: kodejuice
+# Date: 18/10/2026
+# Description: Transposition table in shared memory, read and written by search workers of many processes
+
+# CheckersSharedTT.py
+
+import os
+import struct
+from multiprocessing import shared_memory, resource_tracker
+
+# Bound of a stored score: the exact score, or a lower / upper bound of it
+EXACT, LOWER, UPPER = 0, 1, 2
+
+# The block is a header (magic, number of entries, pid of the creating process) and the entries.
+# An entry is two 64 bit words, key ^ data and data. Entries are written without locks: a reader
+# that meets an entry half written by another process finds that the words do not give back its key
+# and takes it as a miss
+MAGIC = b"CKTT"
+HEADER = struct.Struct("<4sxxxxQQ")
+ENTRY = struct.Struct("<QQ")
+KEY_MASK = (1 << 64) - 1
+
+# data: score (32 bits, signed), depth + 128 (8 bits), bound (2 bits), start and destination
+# (7 bits each, 1 + row * 8 + col, 0 for no move), and a bit always set so no entry is zero
+DEPTH_SHIFT = 32
+BOUND_SHIFT = 40
+START_SHIFT = 42
+DESTINATION_SHIFT = 49
+USED = 1 << 56
+
+
+def _pack(move, depth, score, bound):
+  data = (score & 0xFFFFFFFF) | (max(-128, min(127, depth)) + 128) << DEPTH_SHIFT | bound << BOUND_SHIFT | USED
+  if move is not None:
+    start, destination = move
+    data |= (1 + start[0] * 8 + start[1]) << START_SHIFT | (1 + destination[0] * 8 + destination[1]) << DESTINATION_SHIFT
+  return data
+
+
+def _unpack(data):
+  score = data & 0xFFFFFFFF
+  if score >= 1 << 31:
+    score -= 1 << 32
+  depth = (data >> DEPTH_SHIFT & 0xFF) - 128
+  bound = data >> BOUND_SHIFT & 3
+  start, destination = data >> START_SHIFT & 0x7F, data >> DESTINATION_SHIFT & 0x7F
+  move = (divmod(start - 1, 8), divmod(destination - 1, 8)) if start else None
+  return move, depth, score, bound
+
+
+class SharedTranspositionTable:
+  """Fixed-size hash table of search results in a multiprocessing.shared_memory block.
+  The table is created with a number of entries (rounded up to a power of two) and opened in other
+  processes by name, or by passing the table itself to them (it pickles as its name).
+  An entry is replaced by any result of the same position, and by a result of another position
+  searched at least as deep. The probe and store counters are those of this process"""
+
+  def __init__(self, entries=1 << 20, name=None):
+    if name is None:
+      size = 1 << max(0, entries - 1).bit_length()
+      # a new block is filled with zeros, that is with empty entries
+      self._memory = shared_memory.SharedMemory(create=True, size=HEADER.size + size * ENTRY.size)
+      HEADER.pack_into(self._memory.buf, 0, MAGIC, size, os.getpid())
+      self._owner = True
+    else:
+      self._memory = shared_memory.SharedMemory(name=name)
+      magic, size, pid = HEADER.unpack_from(self._memory.buf, 0)
+      if magic != MAGIC:
+        self._memory.close()
+        raise ValueError(name + " is not a transposition table")
+      if pid != os.getpid():
+        # the creating process removes the block, the resource tracker must not do it when this one exits
+        resource_tracker.unregister(self._memory._name, "shared_memory")
+      self._owner = False
+    self.size = size
+    self._mask = size - 1
+    self._buf = self._memory.buf
+    self.probes = self.hits = self.collisions = 0
+    self.stores = self.overwrites = 0
+
+  @property
+  def name(self):
+    return self._memory.name
+
+  def __getstate__(self):
+    return self.name
+
+  def __setstate__(self, name):
+    self.__init__(name=name)
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc):
+    self.close()
+
+  def close(self):
+    """Detach from the block, the process that created the table also removes it"""
+    self._buf.release()
+    self._memory.close()
+    if self._owner:
+      self._memory.unlink()
+
+  def probe(self, key):
+    """Return (move, depth, score, bound) stored for the position key, None if there is none.
+    move is the (start, destination) best move, None if the search did not find one"""
+    self.probes += 1
+    check, data = ENTRY.unpack_from(self._buf, HEADER.size + (key & self._mask) * ENTRY.size)
+    if not data:
+      return None
+    if check ^ data != key & KEY_MASK:
+      self.collisions += 1
+      return None
+    self.hits += 1
+    return _unpack(data)
+
+  def store(self, key, move, depth, score, bound):
+    """Store the result of a search of the position key to depth"""
+    offset = HEADER.size + (key & self._mask) * ENTRY.size
+    check, data = ENTRY.unpack_from(self._buf, offset)
+    key &= KEY_MASK
+    if data and check ^ data != key:
+      if depth < (data >> DEPTH_SHIFT & 0xFF) - 128:
+        return
+      self.overwrites += 1
+    self.stores += 1
+    data = _pack(move, depth, score, bound)
+    ENTRY.pack_into(self._buf, offset, key ^ data, data)
+
+  def clear(self):
+    """Empty the table for every process"""
+    self._buf[HEADER.size:HEADER.size + self.size * ENTRY.size] = bytes(self.size * ENTRY.size)
+
+  def used(self):
+    """Return the number of entries holding a result"""
+    with self._buf[HEADER.size:HEADER.size + self.size * ENTRY.size].cast("Q") as words:
+      data = words[1::2].tolist()
+    return len(data) - data.count(0)
+
+  def stats(self):
+    """Return the fill rate of the table and the collision rates of the probes and stores of this process.
+    A probe collision finds the entry of another position, a store overwrites one"""
+    used = self.used()
+    return {
+        "entries": self.size,
+        "used": used,
+        "fill_rate": used / self.size,
+        "probes": self.probes,
+        "hits": self.hits,
+        "collisions": self.collisions,
+        "collision_rate": self.collisions / self.probes if self.probes else 0.0,
+        "stores": self.stores,
+        "overwrites": self.overwrites,
+        "overwrite_rate": self.overwrites / self.stores if self.stores else 0.0,
+    }
@@ -0,0 +1,80 @@
+import multiprocessing
+import unittest
+from CheckersSharedTT import *
+from CheckersEngine import SearchEngine
+from CheckersGame import new_game
+
+
+def store_range(task):
+  """Store keys start to stop - 1 in the table from a worker process"""
+  table, start, stop = task
+  for key in range(start, stop):
+    table.store(key, ((5, key % 8), (4, 7 - key % 8)), key % 10, -key, LOWER)
+  found = sum(table.probe(key) is not None for key in range(0, 64))
+  table.close()
+  return found
+
+
+def search_start(table):
+  """Search the start position in a worker process, return the nodes searched"""
+  engine = SearchEngine(max_depth=5, tt=table)
+  engine.search(new_game(), 100)
+  table.close()
+  return engine.nodes
+
+
+class TestCheckersSharedTT(unittest.TestCase):
+  def setUp(self):
+    self.table = SharedTranspositionTable(1000)
+
+  def tearDown(self):
+    self.table.close()
+
+  def test_store_probe(self):
+    self.assertEqual(self.table.size, 1024)
+    self.assertIsNone(self.table.probe(7))
+    self.table.store(7, ((5, 2), (4, 3)), 3, -1234, UPPER)
+    self.assertEqual(self.table.probe(7), (((5, 2), (4, 3)), 3, -1234, UPPER))
+    self.table.store(7, None, -2, 99999, EXACT)
+    self.assertEqual(self.table.probe(7), (None, -2, 99999, EXACT))
+
+    # another position on the same entry is a collision, it replaces the entry if searched as deep
+    self.assertIsNone(self.table.probe(7 + 1024))
+    self.table.store(7 + 1024, None, -3, 0, EXACT)
+    self.assertIsNotNone(self.table.probe(7))
+    self.table.store(7 + 1024, None, 4, 0, EXACT)
+    self.assertIsNone(self.table.probe(7))
+    stats = self.table.stats()
+    self.assertEqual((stats["used"], stats["collisions"], stats["overwrites"]), (1, 2, 1))
+    self.assertEqual(stats["fill_rate"], 1 / 1024)
+
+    # a half written entry does not give back its key
+    check, data = ENTRY.unpack_from(self.table._buf, HEADER.size + 7 * ENTRY.size)
+    ENTRY.pack_into(self.table._buf, HEADER.size + 7 * ENTRY.size, check, data ^ 1)
+    self.assertIsNone(self.table.probe(7 + 1024))
+    self.table.clear()
+    self.assertEqual(self.table.used(), 0)
+
+  def test_processes(self):
+    with multiprocessing.Pool(2) as pool:
+      pool.map(store_range, [(self.table, 0, 32), (self.table, 32, 64)])
+    for key in range(64):
+      self.assertEqual(self.table.probe(key), (((5, key % 8), (4, 7 - key % 8)), key % 10, -key, LOWER))
+    attached = SharedTranspositionTable(name=self.table.name)
+    self.assertEqual(attached.used(), 64)
+    attached.close()
+
+  def test_engine(self):
+    with multiprocessing.Pool(1) as pool:
+      first = pool.apply(search_start, (self.table,))
+      again = pool.apply(search_start, (self.table,))
+    self.assertLess(again, first)
+    self.assertGreater(self.table.used(), 0)
+    # the table does not change the move found
+    engine = SearchEngine(max_depth=5, tt=self.table)
+    self.assertEqual(engine.search(new_game(), 100), SearchEngine(max_depth=5).search(new_game(), 100))
+    self.assertGreater(self.table.hits, 0)
+
+
+if __name__ == '__main__':
+  unittest.main()
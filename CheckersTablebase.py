@@ -0,0 +1,294 @@
+# Author: Biereagu Sochima
+# GitHub username: kodejuice
+# Date: 18/10/2026
+# Description: Endgame tablebase of Checkers positions with kings and triple kings only
+
+# CheckersTablebase.py
+
+import mmap
+import struct
+import sys
+import time
+from array import array
+from itertools import combinations
+from math import comb
+
+from CheckersGame import Checkers, PIECE_NAMES, SQUARE_COORDS, BLACK, WHITE, MAN, KING, TRIPLE_KING, rotate_bitboards
+
+# Positions are classified by their material, the number of black kings, black triple kings,
+# white kings and white triple kings. Men are not covered, kings can only turn into triple kings
+# and captures lead to smaller material, so these positions never leave the tablebase.
+# Only positions with black to move are stored, a position with white to move is looked up
+# as its rotated position (see Checkers.canonical_position).
+GROUP_CODES = (BLACK * 3 + KING, BLACK * 3 + TRIPLE_KING, WHITE * 3 + KING, WHITE * 3 + TRIPLE_KING)
+
+# The playable squares, numbered 0 to 31
+DARK_SQUARES = tuple(square for square, (row, col) in enumerate(SQUARE_COORDS) if (row + col) % 2)
+SQUARE_ORDINALS = {square: ordinal for ordinal, square in enumerate(DARK_SQUARES)}
+
+# Every value is 16 bits: the result for the player to move in the top 2 bits and the number of plies
+# to the end of the game in the others (the winner plays the shortest win, the loser the longest defence).
+# DRAW means neither player can force a win
+DRAW, WIN, LOSS = 0, 1, 2
+RESULT_SHIFT = 14
+DISTANCE_MASK = (1 << RESULT_SHIFT) - 1
+
+# File layout: header, one directory entry per material, then the values of every material.
+# The value of a position with black to move is at offset + 2 * index
+MAGIC = b"CKTB"
+VERSION = 2
+HEADER = struct.Struct("<4sBBH")
+ENTRY = struct.Struct("<4BQI")
+VALUE = struct.Struct("<H")
+
+
+def materials(pieces):
+  """Return the materials with given number of pieces and at least one piece per player"""
+  return [(bk, bt, wk, pieces - bk - bt - wk)
+          for bk in range(pieces + 1) for bt in range(pieces + 1 - bk) for wk in range(pieces + 1 - bk - bt)
+          if bk + bt > 0 and pieces - bk - bt > 0]
+
+
+def table_size(material):
+  """Return the number of placements of the pieces of a material"""
+  size, free = 1, len(DARK_SQUARES)
+  for count in material:
+    size *= comb(free, count)
+    free -= count
+  return size
+
+
+def material_of(bitboards):
+  """Return the material of a position, None if it has men"""
+  if bitboards[BLACK * 3 + MAN] or bitboards[WHITE * 3 + MAN]:
+    return None
+  return tuple(bitboards[code].bit_count() for code in GROUP_CODES)
+
+
+def position_index(material, bitboards):
+  """Return the index of a position among the placements of its material.
+  Every group of pieces is ranked as a combination of the squares the previous groups left free"""
+  index, taken, free = 0, 0, len(DARK_SQUARES)
+  for count, code in zip(material, GROUP_CODES):
+    rank = i = 0
+    mask = bitboards[code]
+    ordinals = 0
+    while mask:
+      bit = mask & -mask
+      mask ^= bit
+      ordinals |= 1 << SQUARE_ORDINALS[bit.bit_length() - 1]
+    group = ordinals
+    while ordinals:
+      bit = ordinals & -ordinals
+      ordinals ^= bit
+      i += 1
+      rank += comb(bit.bit_length() - 1 - (taken & (bit - 1)).bit_count(), i)
+    index = index * comb(free, count) + rank
+    taken |= group
+    free -= count
+  return index
+
+
+def placements(material):
+  """Yield the bitboards of every placement of the pieces of a material"""
+  def place(group, free, bitboards):
+    if group == len(GROUP_CODES):
+      yield bitboards
+      return
+    for squares in combinations(free, material[group]):
+      placed = bitboards[:]
+      placed[GROUP_CODES[group]] = sum(1 << square for square in squares)
+      yield from place(group + 1, [square for square in free if square not in squares], placed)
+
+  yield from place(0, list(DARK_SQUARES), [0] * len(PIECE_NAMES))
+
+
+def _canonical(bitboards, side):
+  """Return the bitboards of the position with black to move equivalent to the position with side to move"""
+  return bitboards if side == BLACK else rotate_bitboards(bitboards)
+
+
+def _solve(pieces, solved, game):
+  """Compute the values of all positions with given number of pieces and black to move.
+  solved maps the materials with fewer pieces to their values. Returns {material: values}"""
+  bases, states = {}, 0
+  for material in materials(pieces):
+    bases[material] = states
+    states += table_size(material)
+
+  values = array("H", bytes(2 * states))
+  resolved = bytearray(states)
+  remaining = array("I", bytes(4 * states))
+  edge_to, edge_from = array("I"), array("I")
+  buckets = {}   # distance -> states resolved at that distance
+  # distance -> 2 * state + 1 if a move of the state wins into a smaller position solved at that distance,
+  # 2 * state if it loses (moves into drawn positions are never resolved)
+  external = {}
+
+  def resolve(state, result, distance):
+    resolved[state] = 1
+    values[state] = result << RESULT_SHIFT | distance
+    buckets.setdefault(distance, []).append(state)
+
+  # forward pass: the moves of every position
+  for material, base in bases.items():
+    for bitboards in placements(material):
+      state = base + position_index(material, bitboards)
+      game._set_bitboards(bitboards[:])
+      game.player_to_move_index = BLACK
+      moves = game._get_player_moves(BLACK)
+      remaining[state] = len(moves)
+      if not moves:
+        resolve(state, LOSS, 0)
+      for start, destination, _ in moves:
+        token = game.make_move(start, destination)
+        next_side = game.player_to_move_index
+        next_bitboards = _canonical(game._bitboards, next_side)
+        next_material = material_of(next_bitboards)
+        if sum(next_material) == pieces:
+          edge_to.append(bases[next_material] + position_index(next_material, next_bitboards))
+          edge_from.append(2 * state + (next_side == BLACK))
+        else:
+          result, distance = _lookup(solved, next_material, next_bitboards)
+          if result != DRAW:
+            wins = result == (WIN if next_side == BLACK else LOSS)
+            external.setdefault(distance, []).append(2 * state + wins)
+        game.unmake_move(token)
+
+  # the positions leading to every position, grouped by position
+  offsets = array("I", bytes(4 * (states + 1)))
+  for state in edge_to:
+    offsets[state + 1] += 1
+  for state in range(states):
+    offsets[state + 1] += offsets[state]
+  predecessors = array("I", bytes(4 * len(edge_to)))
+  fill = offsets[:-1]
+  for state, edge in zip(edge_to, edge_from):
+    predecessors[fill[state]] = edge
+    fill[state] += 1
+  del edge_to, edge_from, fill
+
+  def reach(state, wins, distance):
+    if resolved[state]:
+      return
+    if wins:
+      resolve(state, WIN, distance)
+    else:
+      remaining[state] -= 1
+      if remaining[state] == 0:
+        resolve(state, LOSS, distance)
+
+  # backward pass in increasing distance: a position is won as soon as one move wins,
+  # lost once every move has been found to lose
+  distance = 0
+  while buckets or external:
+    for event in external.pop(distance, ()):
+      reach(event >> 1, event & 1, distance + 1)
+    for state in buckets.pop(distance, ()):
+      result = values[state] >> RESULT_SHIFT
+      for edge in predecessors[offsets[state]:offsets[state + 1]]:
+        same_side = edge & 1
+        reach(edge >> 1, result == (WIN if same_side else LOSS), distance + 1)
+    distance += 1
+
+  return {material: values[base:base + table_size(material)] for material, base in bases.items()}
+
+
+def _lookup(solved, material, bitboards):
+  """Return (result, distance) of a position of a solved material with black to move"""
+  if sum(material[:2]) == 0 or sum(material[2:]) == 0:
+    # a player without pieces has lost
+    return (LOSS if sum(material[:2]) == 0 else WIN), 0
+  value = solved[material][position_index(material, bitboards)]
+  return value >> RESULT_SHIFT, value & DISTANCE_MASK
+
+
+def build(path, max_pieces=3):
+  """Solve all positions of kings and triple kings with up to max_pieces pieces and write them to path.
+  Returns the number of positions (with black to move) of every result and the time taken"""
+  begin = time.perf_counter()
+  game = Checkers()
+  game.create_player("White", "White")
+  game.create_player("Black", "Black")
+  solved = {}
+  for pieces in range(2, max_pieces + 1):
+    solved.update(_solve(pieces, solved, game))
+
+  tables = sorted(solved.items())
+  offset = HEADER.size + ENTRY.size * len(tables)
+  counts = [0, 0, 0]
+  with open(path, "wb") as out:
+    out.write(HEADER.pack(MAGIC, VERSION, max_pieces, len(tables)))
+    for material, values in tables:
+      out.write(ENTRY.pack(*material, offset, len(values)))
+      offset += 2 * len(values)
+    for material, values in tables:
+      for value in values:
+        counts[value >> RESULT_SHIFT] += 1
+      if sys.byteorder != "little":
+        values = array("H", values)
+        values.byteswap()
+      out.write(values.tobytes())
+  return {
+      "positions": sum(counts),
+      "wins": counts[WIN],
+      "losses": counts[LOSS],
+      "draws": counts[DRAW],
+      "seconds": time.perf_counter() - begin,
+  }
+
+
+class Tablebase:
+  """Memory mapped tablebase written by build, probing a position reads one value"""
+
+  def __init__(self, path):
+    with open(path, "rb") as tablebase:
+      self._data = mmap.mmap(tablebase.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, self.max_pieces, count = HEADER.unpack_from(self._data, 0)
+    if magic != MAGIC or version != VERSION:
+      raise ValueError(path + " is not a tablebase of version %d" % VERSION)
+    self._offsets = {}
+    for i in range(count):
+      *material, offset, _ = ENTRY.unpack_from(self._data, HEADER.size + i * ENTRY.size)
+      self._offsets[tuple(material)] = offset
+
+  def close(self):
+    self._data.close()
+
+  def probe(self, game):
+    """Return (result, distance) of the position of the game for the player to move,
+    None if the position is not in the tablebase"""
+    bitboards = game._bitboards
+    if material_of(bitboards) is None:
+      return None
+    bitboards = _canonical(bitboards, game.player_to_move_index)
+    material = material_of(bitboards)
+    if sum(material[:2]) == 0 or sum(material[2:]) == 0:
+      return (LOSS if sum(material[:2]) == 0 else WIN), 0
+    offset = self._offsets.get(material)
+    if offset is None:
+      return None
+    value = VALUE.unpack_from(self._data, offset + 2 * position_index(material, bitboards))[0]
+    return value >> RESULT_SHIFT, value & DISTANCE_MASK
+
+  def winner(self, game):
+    """Return the name of the player who wins the position with best play, "Draw" if neither can force a win,
+    None if the position is not in the tablebase"""
+    value = self.probe(game)
+    if value is None:
+      return None
+    if value[0] == DRAW:
+      return "Draw"
+    side = game.player_to_move_index
+    return game.players[side if value[0] == WIN else 1 - side].player_name
+
+
+def main(argv):
+  path = argv[1] if len(argv) > 1 else "kings.tb"
+  max_pieces = int(argv[2]) if len(argv) > 2 else 3
+  stats = build(path, max_pieces)
+  print("%(positions)d positions (%(wins)d won, %(losses)d lost, %(draws)d drawn) in %(seconds).1fs" % stats)
+
+
+if __name__ == '__main__':
+  main(sys.argv)
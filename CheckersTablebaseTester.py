@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+from CheckersTablebase import *
+from CheckersEngine import SearchEngine, WIN_SCORE
+from CheckersGame import new_game
+from CheckersPerft import POSITIONS
+
+
+def layout(*pieces):
+  """Return an empty layout with given (row, col, token) pieces"""
+  rows = [["-"] * 8 for _ in range(8)]
+  for row, col, token in pieces:
+    rows[row][col] = token
+  return rows
+
+
+class TestCheckersTablebase(unittest.TestCase):
+  @classmethod
+  def setUpClass(cls):
+    cls.path = os.path.join(tempfile.mkdtemp(), "kings.tb")
+    cls.stats = build(cls.path, 2)
+    cls.tablebase = Tablebase(cls.path)
+
+  @classmethod
+  def tearDownClass(cls):
+    cls.tablebase.close()
+
+  def test_index(self):
+    # every placement of a material has its own index
+    for material in [(1, 0, 1, 0), (0, 1, 0, 1), (2, 0, 0, 1), (1, 1, 1, 0)]:
+      indices = [position_index(material, bitboards) for bitboards in placements(material)]
+      self.assertEqual(sorted(indices), list(range(table_size(material))))
+
+  def test_stats(self):
+    # positions with white to move are not stored
+    self.assertEqual(self.stats["positions"], sum(table_size(m) for m in materials(2)))
+    self.assertEqual(self.stats["positions"], self.stats["wins"] + self.stats["losses"] + self.stats["draws"])
+
+  def test_probe(self):
+    game = new_game(layout((5, 2, "Bk"), (4, 3, "Wk")))
+    self.assertEqual(self.tablebase.probe(game), (WIN, 1))
+    self.assertEqual(self.tablebase.winner(game), "Black")
+    game.player_to_move_index = WHITE
+    self.assertEqual(self.tablebase.probe(game), (WIN, 1))
+    self.assertEqual(self.tablebase.winner(game), "White")
+
+    # not in the tablebase: men, or too many pieces
+    self.assertIsNone(self.tablebase.probe(new_game()))
+    self.assertIsNone(self.tablebase.probe(new_game(layout((5, 2, "Bk"), (4, 3, "Wk"), (0, 1, "Wk")))))
+    self.assertIsNone(self.tablebase.winner(new_game(POSITIONS["kings"])))
+
+  def test_consistent(self):
+    # the value of a position follows from the values of the positions after its moves
+    game = new_game()
+    for material in materials(2):
+      for bitboards in list(placements(material))[::13]:
+        for side in (BLACK, WHITE):
+          game._set_bitboards(bitboards[:])
+          game.player_to_move_index = side
+          result, distance = self.tablebase.probe(game)
+          outcomes = []
+          for start, destination, _ in game.legal_moves():
+            token = game.make_move(start, destination)
+            next_side = game.player_to_move_index
+            next_result, next_distance = self.tablebase.probe(game)
+            game.unmake_move(token)
+            if next_side != side and next_result != DRAW:
+              next_result = WIN + LOSS - next_result
+            outcomes += [(next_result, next_distance)]
+          if result == WIN:
+            self.assertEqual(distance, 1 + min(d for r, d in outcomes if r == WIN))
+          elif result == LOSS:
+            self.assertTrue(all(r == LOSS for r, d in outcomes))
+            self.assertEqual(distance, 1 + max([d for r, d in outcomes] or [-1]))
+          else:
+            self.assertNotIn(WIN, [r for r, d in outcomes])
+
+  def test_engine(self):
+    game = new_game(layout((5, 2, "Bk"), (4, 3, "Wk")))
+    engine = SearchEngine(tablebase=self.tablebase)
+    self.assertEqual(engine.search(game, 0.5), ((5, 2), (3, 4)))
+    self.assertEqual(engine.score, WIN_SCORE - 1)
+
+
+if __name__ == '__main__':
+  unittest.main()